@@ -142,12 +142,13 @@ async def _create_indexes(db: AsyncIOMotorDatabase):
     # Affiliate & Holistic Products
     await db.products.create_index("product_id", unique=True)
     await db.products.create_index("name")
-    await db.products.create_index("product_type")
+    await db.products.create_index([("product_type", 1), ("name", 1)])  # Per-type listing, sorted by name
     await db.products.create_index([("name", "text")])
 
     await db.symptoms.create_index("symptom_id", unique=True)
     await db.symptoms.create_index("slug", unique=True)
-    await db.symptoms.create_index("category")
+    await db.symptoms.create_index([("category", 1), ("name", 1)])  # Per-category listing, sorted by name
+    await db.symptoms.create_index("recommended_products")  # Multikey: symptoms recommending a product
     await db.symptoms.create_index([("name", "text"), ("keywords", "text")])
 
     await db.lab_tests.create_index("test_id", unique=True)
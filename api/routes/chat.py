@@ -5,21 +5,22 @@ Main conversational interface for the peptide AI assistant.
 """
 
 from fastapi import APIRouter, Depends, Request, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List, AsyncGenerator
+from typing import Optional, List, Dict, Tuple, AsyncGenerator
 from datetime import datetime
 from uuid import uuid4
 import openai
 import logging
 import json
+import orjson
 
 import re
 from api.deps import get_database, get_settings
 from api.middleware.auth import get_current_user
 from api.journey_service import JourneyService
-from llm.rag_pipeline import RAGPipeline
-from storage.weaviate_client import WeaviateClient
+from llm.rag_pipeline import RAGPipeline, filter_token_stream
+from storage.weaviate_client import WeaviateClient, VECTORIZER_MODEL
 
 logger = logging.getLogger(__name__)
 
@@ -271,7 +272,7 @@ async def chat(
         upsert=True
     )
 
-    return ChatResponse(
+    chat_response = ChatResponse(
         conversation_id=conversation_id,
         message=response_text,
         sources=rag_result.get("sources", []),
@@ -280,6 +281,13 @@ async def chat(
         metadata=rag_result.get("metadata", {"model": settings.openai_model})
     )
 
+    # Serialize straight from pydantic-core, skipping FastAPI's
+    # jsonable_encoder pass and response_model re-validation
+    return Response(
+        content=chat_response.model_dump_json(),
+        media_type="application/json"
+    )
+
 
 @router.post("/chat/stream")
 async def chat_stream(
@@ -289,7 +297,8 @@ async def chat_stream(
 ):
     """
     Stream a chat response using Server-Sent Events.
-    Returns chunks of the response as they're generated.
+    Returns chunks of the response as they're generated, a line at a
+    time once each line has passed the safety filter.
     """
     db = get_database()
     settings = get_settings()
@@ -323,18 +332,10 @@ async def chat_stream(
         """Generate SSE stream"""
         try:
             # Send conversation ID first
-            yield f"data: {json.dumps({'type': 'conversation_id', 'conversation_id': conversation_id})}\n\n"
+            yield _sse_event({'type': 'conversation_id', 'conversation_id': conversation_id})
 
             # Initialize clients
-            if settings.llm_provider == "ollama":
-                llm_client = openai.AsyncOpenAI(
-                    base_url=f"{settings.ollama_url}/v1",
-                    api_key="ollama"
-                )
-                model = settings.ollama_model
-            else:
-                llm_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
-                model = settings.openai_model
+            llm_client, model = _get_llm_client(settings)
 
             weaviate = WeaviateClient(
                 url=settings.weaviate_url,
@@ -375,7 +376,7 @@ async def chat_stream(
                         "url": props.get("url", ""),
                         "type": props.get("source_type", "unknown")
                     })
-                yield f"data: {json.dumps({'type': 'sources', 'sources': sources})}\n\n"
+                yield _sse_event({'type': 'sources', 'sources': sources})
 
                 # Build mode-specific system prompt
                 # If no explicit mode set, detect intent from message
@@ -387,7 +388,7 @@ async def chat_stream(
                         logger.info(f"[Chat] Auto-detected mode: {response_mode}")
 
                 # Send detected mode to frontend for UI adjustments
-                yield f"data: {json.dumps({'type': 'mode', 'mode': response_mode})}\n\n"
+                yield _sse_event({'type': 'mode', 'mode': response_mode})
 
                 system_prompt = _get_system_prompt_for_mode(response_mode)
 
@@ -438,11 +439,16 @@ async def chat_stream(
                     stream=True
                 )
 
-                async for chunk in stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
-                        full_response += content
-                        yield f"data: {json.dumps({'type': 'content', 'content': content})}\n\n"
+                async def tokens() -> AsyncGenerator[str, None]:
+                    async for chunk in stream:
+                        if chunk.choices[0].delta.content:
+                            yield chunk.choices[0].delta.content
+
+                # Released a line at a time through the safety filter, so
+                # vendor text never reaches the client or the saved message
+                async for content in filter_token_stream(tokens()):
+                    full_response += content
+                    yield _sse_event({'type': 'content', 'content': content})
 
                 # Generate contextual follow-ups using LLM
                 try:
@@ -488,7 +494,7 @@ Return ONLY a JSON array of 3-4 question strings."""
                     "Always consult a qualified healthcare professional before using any peptides."
                 ]
 
-                yield f"data: {json.dumps({'type': 'done', 'disclaimers': disclaimers, 'follow_up_questions': follow_ups})}\n\n"
+                yield _sse_event({'type': 'done', 'disclaimers': disclaimers, 'follow_up_questions': follow_ups})
 
                 # Save conversation with sources/follow-ups attached to message
                 assistant_message_dict = {
@@ -523,7 +529,7 @@ Return ONLY a JSON array of 3-4 question strings."""
 
         except Exception as e:
             logger.error(f"Streaming error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield _sse_event({'type': 'error', 'error': str(e)})
 
     return StreamingResponse(
         generate_stream(),
@@ -776,6 +782,42 @@ async def get_shared_conversation(share_id: str):
 # HELPER FUNCTIONS (Placeholder implementations)
 # =============================================================================
 
+def _sse_event(payload: dict) -> str:
+    """Format a Server-Sent Events data frame (orjson: one per streamed token)"""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+
+# LLM clients are shared across requests so their connection pools are too
+_llm_clients: Dict[str, openai.AsyncOpenAI] = {}
+
+
+def _get_llm_client(settings) -> Tuple[openai.AsyncOpenAI, str]:
+    """
+    Get the shared LLM client and model name for the configured provider
+
+    Clients use the aiohttp transport, which holds up better than the
+    default httpx one under many concurrent completions.
+    """
+    if settings.llm_provider == "ollama":
+        # Use Ollama via OpenAI-compatible API
+        key = f"ollama:{settings.ollama_url}"
+        if key not in _llm_clients:
+            _llm_clients[key] = openai.AsyncOpenAI(
+                base_url=f"{settings.ollama_url}/v1",
+                api_key="ollama",  # Ollama doesn't need a real key
+                http_client=openai.DefaultAioHttpClient()
+            )
+        return _llm_clients[key], settings.ollama_model
+
+    key = "openai"
+    if key not in _llm_clients:
+        _llm_clients[key] = openai.AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=openai.DefaultAioHttpClient()
+        )
+    return _llm_clients[key], settings.openai_model
+
+
 async def _generate_response(
     query: str,
     messages: list,
@@ -796,19 +838,11 @@ async def _generate_response(
     - metadata: Generation metadata
     """
     try:
-        # Initialize LLM client based on provider
+        # Get LLM client based on provider
+        llm_client, model = _get_llm_client(settings)
         if settings.llm_provider == "ollama":
-            # Use Ollama via OpenAI-compatible API
-            llm_client = openai.AsyncOpenAI(
-                base_url=f"{settings.ollama_url}/v1",
-                api_key="ollama"  # Ollama doesn't need a real key
-            )
-            model = settings.ollama_model
             logger.info(f"Using Ollama at {settings.ollama_url} with model {model}")
         else:
-            # Use OpenAI
-            llm_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
-            model = settings.openai_model
             logger.info(f"Using OpenAI with model {model}")
 
         # Initialize Weaviate client
@@ -841,7 +875,9 @@ async def _generate_response(
             rag = RAGPipeline(
                 weaviate_client=weaviate,
                 openai_client=llm_client,
-                model=model
+                model=model,
+                # Ollama can't serve the OpenAI embedding model
+                embedding_model=None if settings.llm_provider == "ollama" else VECTORIZER_MODEL
             )
 
             result = await rag.generate_response(
@@ -908,6 +944,14 @@ def _get_disclaimers(query: str) -> List[str]:
     return disclaimers
 
 
+# Generic follow-ups for now
+_DEFAULT_FOLLOWUPS = (
+    "What's a typical protocol for this?",
+    "What side effects should I watch for?",
+    "How does this compare to alternatives?",
+)
+
+
 def _suggest_followups(query: str) -> List[str]:
     """
     Suggest relevant follow-up questions
@@ -917,12 +961,7 @@ def _suggest_followups(query: str) -> List[str]:
     - Response content
     - User's journey stage
     """
-    # Generic follow-ups for now
-    return [
-        "What's a typical protocol for this?",
-        "What side effects should I watch for?",
-        "How does this compare to alternatives?"
-    ]
+    return list(_DEFAULT_FOLLOWUPS)
 
 
 def _get_system_prompt_for_mode(mode: str) -> str:
@@ -8,6 +8,7 @@ allowing tests to run without making real API calls.
 from typing import Any, Optional, AsyncIterator
 from dataclasses import dataclass, field
 import asyncio
+import zlib
 
 
 @dataclass
@@ -169,6 +170,47 @@ class MockChatCompletions:
         return self._parent.default_response
 
 
+@dataclass
+class MockEmbedding:
+    """Mock embedding item."""
+    embedding: list[float]
+    index: int = 0
+
+
+@dataclass
+class MockEmbeddingResponse:
+    """Mock embeddings response."""
+    data: list[MockEmbedding]
+    model: str = "mock-embedding-model"
+
+
+class MockEmbeddings:
+    """
+    Mock embeddings API.
+
+    Vectors are bag-of-words counts hashed into a fixed number of
+    dimensions, so texts with the same words embed identically.
+    """
+
+    DIMENSIONS = 64
+
+    def __init__(self, parent: "MockLLMClient"):
+        self._parent = parent
+
+    async def create(self, model: str, input: str, **kwargs: Any) -> MockEmbeddingResponse:
+        """Create an embedding for a single input string."""
+        self._parent.embedding_calls.append({"model": model, "input": input, **kwargs})
+
+        vector = [0.0] * self.DIMENSIONS
+        for word in input.lower().split():
+            vector[zlib.crc32(word.strip("?.!,").encode()) % self.DIMENSIONS] += 1.0
+
+        # Small delay to simulate network
+        await asyncio.sleep(0.001)
+
+        return MockEmbeddingResponse(data=[MockEmbedding(embedding=vector)], model=model)
+
+
 class MockChatNamespace:
     """Mock chat namespace (client.chat)."""
 
@@ -221,16 +263,24 @@ class MockLLMClient:
         self.response_patterns = response_patterns or {}
         self.stream_chunk_size = stream_chunk_size
         self.call_history: list[dict[str, Any]] = []
+        self.embedding_calls: list[dict[str, Any]] = []
         self._chat = MockChatNamespace(self)
+        self._embeddings = MockEmbeddings(self)
 
     @property
     def chat(self) -> MockChatNamespace:
         """Access the chat API namespace."""
         return self._chat
 
+    @property
+    def embeddings(self) -> MockEmbeddings:
+        """Access the embeddings API namespace."""
+        return self._embeddings
+
     def reset(self) -> None:
         """Reset call history and responses (helper for tests)."""
         self.call_history = []
+        self.embedding_calls = []
         self.responses = {}
         self.response_patterns = {}
 
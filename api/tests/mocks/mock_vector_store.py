@@ -5,6 +5,7 @@ Provides an in-memory implementation of vector search operations,
 allowing tests to run without a real Weaviate connection.
 """
 
+import asyncio
 from typing import Any, Optional
 from dataclasses import dataclass, field
 from copy import deepcopy
@@ -58,6 +59,8 @@ class MockVectorStore:
         self._connected: bool = False
         self._schema_created: bool = False
         self.call_history: list[dict[str, Any]] = []
+        # Embedding model query vectors may come from (WeaviateClient reads it from the schema)
+        self.query_vector_model: Optional[str] = None
 
     async def connect(self) -> None:
         """Establish connection (no-op for mock)."""
@@ -111,21 +114,26 @@ class MockVectorStore:
         query: str,
         limit: int = 10,
         alpha: float = 0.5,
+        source_filter: Optional[str] = None,
         peptide_filter: Optional[list[str]] = None,
         include_outcomes: bool = True,
+        vector: Optional[list[float]] = None,
     ) -> list[dict[str, Any]]:
         """
         Perform hybrid search (keyword-based for mock).
 
         Combines chunk and outcome results based on keyword matching.
+        source_filter and vector are recorded but not applied.
         """
         self.call_history.append({
             "operation": "hybrid_search",
             "query": query,
             "limit": limit,
             "alpha": alpha,
+            "source_filter": source_filter,
             "peptide_filter": peptide_filter,
             "include_outcomes": include_outcomes,
+            "vector": vector,
         })
 
         results: list[tuple[float, dict[str, Any]]] = []
@@ -233,6 +241,24 @@ class MockVectorStore:
             vector=vector,
         )
 
+    async def index_chunks_batch(self, chunks: list[Any]) -> list[int]:
+        """Index processed chunks; returns the positions that failed (none)."""
+        self.call_history.append({
+            "operation": "index_chunks_batch",
+            "chunk_ids": [chunk.chunk_id for chunk in chunks],
+        })
+
+        # Small delay to simulate network
+        await asyncio.sleep(0.001)
+
+        for chunk in chunks:
+            self._chunks[chunk.chunk_id] = MockChunk(
+                id=chunk.chunk_id,
+                content=chunk.content,
+                properties={"title": chunk.title, "peptides": list(chunk.peptides_mentioned)},
+            )
+        return []
+
     async def index_outcome(
         self,
         outcome_id: str,
@@ -0,0 +1,209 @@
+"""
+Tests for the LLM circuit breaker and retry classification.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import llm.circuit_breaker as circuit_breaker
+import llm.rag_pipeline as rag_pipeline
+from llm.circuit_breaker import CircuitBreaker, CircuitOpenError
+from llm.rag_pipeline import RAGPipeline
+from api.tests.mocks import MockVectorStore
+
+
+class FakeClock:
+    """Stands in for time.monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # Patch the module's reference only; the event loop needs the real clock
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", fail_max=3, reset_timeout=30)
+
+
+def trip(breaker: CircuitBreaker):
+    for _ in range(breaker.fail_max):
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_closed_until_fail_max(self, breaker):
+        """Failures below fail_max should not open the breaker."""
+        breaker.record_failure()
+        breaker.record_failure()
+
+        assert not breaker.is_open
+        breaker.before_call()
+
+    def test_success_resets_failure_count(self, breaker):
+        """Only consecutive failures should count."""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert not breaker.is_open
+
+    def test_opens_at_fail_max(self, breaker):
+        """Reaching fail_max should reject calls."""
+        trip(breaker)
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_lets_one_trial_through(self, breaker, clock):
+        """After reset_timeout, one caller gets through and the rest wait."""
+        trip(breaker)
+        clock.now += 31
+
+        breaker.before_call()  # Trial
+        for _ in range(3):
+            with pytest.raises(CircuitOpenError):
+                breaker.before_call()
+
+    def test_trial_success_closes(self, breaker, clock):
+        """A successful trial should close the breaker for everyone."""
+        trip(breaker)
+        clock.now += 31
+        breaker.before_call()
+
+        breaker.record_success()
+
+        assert not breaker.is_open
+        breaker.before_call()
+        breaker.before_call()
+
+    def test_trial_failure_reopens(self, breaker, clock):
+        """A failed trial should restart the open period."""
+        trip(breaker)
+        clock.now += 31
+        breaker.before_call()
+
+        breaker.record_failure()
+        clock.now += 29
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        clock.now += 2
+        breaker.before_call()  # Next trial
+
+    def test_lost_trial_is_replaced(self, breaker, clock):
+        """A trial that never reports back should not block forever."""
+        trip(breaker)
+        clock.now += 31
+        breaker.before_call()  # Trial is cancelled and never records
+
+        clock.now += 29
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        clock.now += 2
+        breaker.before_call()
+
+
+def request() -> httpx.Request:
+    return httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(cls, status: int):
+    return cls("error", response=httpx.Response(status, request=request()), body=None)
+
+
+class FailingCompletions:
+    """Raises the queued errors in order, then returns "ok"."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class FailingClient:
+    def __init__(self, errors):
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = FailingCompletions(errors)
+
+
+@pytest.fixture
+def llm_breaker(clock, monkeypatch):
+    breaker = CircuitBreaker("llm", fail_max=2, reset_timeout=30)
+    monkeypatch.setattr(rag_pipeline, "_llm_breaker", breaker)
+    return breaker
+
+
+def make_pipeline(errors) -> RAGPipeline:
+    return RAGPipeline(MockVectorStore(), FailingClient(errors), model="mock-model")
+
+
+class TestRetryClassification:
+    """Tests for which provider errors are retried and counted."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        status_error(openai.RateLimitError, 429),
+        status_error(openai.InternalServerError, 500),
+        openai.APITimeoutError(request=request()),
+        openai.APIConnectionError(request=request()),
+    ])
+    async def test_transient_errors_are_retried(self, llm_breaker, error):
+        """Transient errors should be retried and not count as failures."""
+        rag = make_pipeline([error])
+
+        assert await rag._create_completion(model="mock-model", messages=[]) == "ok"
+        assert rag.openai.chat.completions.calls == 2
+        assert llm_breaker._failures == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_count_one_failure(self, llm_breaker):
+        """A call that fails every attempt should count once."""
+        rag = make_pipeline([openai.APITimeoutError(request=request())] * 3)
+
+        with pytest.raises(openai.APITimeoutError):
+            await rag._create_completion(model="mock-model", messages=[])
+        assert rag.openai.chat.completions.calls == 3
+        assert llm_breaker._failures == 1
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, llm_breaker):
+        """4xx errors should fail immediately without counting."""
+        llm_breaker.record_failure()
+        rag = make_pipeline([status_error(openai.BadRequestError, 400)])
+
+        with pytest.raises(openai.BadRequestError):
+            await rag._create_completion(model="mock-model", messages=[])
+        assert rag.openai.chat.completions.calls == 1
+        assert llm_breaker._failures == 0
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_the_call(self, llm_breaker):
+        """An open breaker should reject before reaching the provider."""
+        trip(llm_breaker)
+        rag = make_pipeline([])
+
+        with pytest.raises(CircuitOpenError):
+            await rag._create_completion(model="mock-model", messages=[])
+        assert rag.openai.chat.completions.calls == 0
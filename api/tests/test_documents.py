@@ -0,0 +1,36 @@
+"""
+Tests for document models.
+"""
+
+from models.documents import ProcessedChunk, SourceType
+
+
+def make_chunk(**kwargs) -> ProcessedChunk:
+    fields = {
+        "chunk_id": "c1",
+        "document_id": "d1",
+        "source_type": SourceType.PUBMED,
+        "content": "BPC-157 accelerated tendon healing.",
+        "title": "BPC-157 and tendons",
+        "url": "https://pubmed.ncbi.nlm.nih.gov/1",
+    }
+    return ProcessedChunk(**{**fields, **kwargs})
+
+
+class TestProcessedChunk:
+    """Tests for the ProcessedChunk dataclass."""
+
+    def test_embeddings_stored_as_float16(self):
+        """Embeddings should be coerced to float16 arrays."""
+        chunk = make_chunk(embedding_openai=[0.1, 0.2, 0.3])
+
+        assert chunk.embedding_openai.dtype.name == "float16"
+        assert chunk.embedding_openai.shape == (3,)
+
+    def test_equality_with_embeddings(self):
+        """Chunks with embeddings should compare without raising."""
+        a = make_chunk(embedding_openai=[0.1, 0.2, 0.3], embedding_pubmedbert=[1.0, 2.0])
+        b = make_chunk(embedding_openai=[0.1, 0.2, 0.3], embedding_pubmedbert=[1.0, 2.0])
+
+        assert a == b
+        assert a != make_chunk(chunk_id="c2", embedding_openai=[0.1, 0.2, 0.3])
@@ -0,0 +1,39 @@
+"""
+Tests for the query embedding cache.
+"""
+
+from llm.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_get_returns_stored_embedding(self):
+        """A stored embedding should be returned for the same text."""
+        cache = EmbeddingCache()
+        cache.put("What is BPC-157?", [0.1, 0.2])
+
+        assert cache.get("What is BPC-157?") == [0.1, 0.2]
+        assert cache.get("What is TB-500?") is None
+
+    def test_counts_hits_and_misses(self):
+        """stats() should report hits, misses and size."""
+        cache = EmbeddingCache()
+        cache.put("a", [1.0])
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_evicts_least_recently_used(self):
+        """When full, the least recently used text should be dropped."""
+        cache = EmbeddingCache(max_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # Touch "a"
+        cache.put("c", [3.0])
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
@@ -0,0 +1,163 @@
+"""
+Tests for the document enricher.
+"""
+
+import random
+import re
+
+import pytest
+
+from models.documents import ProcessedChunk, SourceType
+from processing.enricher import (
+    PeptideEnricher,
+    POOL_CHUNKSIZE,
+    _FusedMatcher,
+    start_enrich_pool,
+)
+
+
+def make_chunk(content: str, chunk_id: str = "c1") -> ProcessedChunk:
+    return ProcessedChunk(
+        chunk_id=chunk_id,
+        document_id="d1",
+        source_type=SourceType.PUBMED,
+        content=content,
+        title="Test chunk",
+        url="https://pubmed.ncbi.nlm.nih.gov/1",
+    )
+
+
+class TestEnrichBatch:
+    """Tests for in-process and pooled batch enrichment."""
+
+    def test_pool_matches_in_process(self):
+        """A pooled batch should enrich the same as in-process, in order."""
+        contents = [
+            "BPC-157 and TB-500 for tendon healing",
+            "Semaglutide for weight loss",
+            "No peptides here",
+        ]
+        chunks = [
+            make_chunk(contents[i % 3], chunk_id=str(i)) for i in range(3 * POOL_CHUNKSIZE)
+        ]
+        enricher = PeptideEnricher()
+        expected = [
+            (sorted(c.peptides_mentioned), c.fda_status, sorted(c.conditions_mentioned))
+            for c in enricher.enrich_batch([make_chunk(c.content, c.chunk_id) for c in chunks])
+        ]
+
+        pool = start_enrich_pool(2)
+        try:
+            enriched = enricher.enrich_batch(chunks, pool=pool)
+        finally:
+            pool.shutdown()
+
+        assert [c.chunk_id for c in enriched] == [c.chunk_id for c in chunks]
+        assert [
+            (sorted(c.peptides_mentioned), c.fda_status, sorted(c.conditions_mentioned))
+            for c in enriched
+        ] == expected
+
+
+def baseline_find(patterns, text):
+    """The original matcher: each pattern searched over lowercased str."""
+    text = text.lower()
+    return {name for pattern, name in patterns.items() if re.search(pattern, text, re.IGNORECASE)}
+
+
+SEPARATORS = [" ", "-", ", ", ".", "é", "’", "—", "\xa0", "ß", "\u03b2"]
+
+CASES = [
+    "tirzepatide-sermoreliné",
+    "tendon injuryé",
+    "Ozempic’s effect",
+    "BPC-157—a peptide",
+    "éBPC-157 and bpc-157é",
+    "TΒ4 and tβ4",
+    "tissue repair",
+    "Tissue Repair\xa0after tendon injury",
+    "CJC-1295 w/ DAC — ipamorelin",
+]
+
+
+def alias_soup(rng, patterns):
+    """Random mix of alias-like words from the tables and separators."""
+    words = [w for p in patterns for w in re.findall(r"[a-z0-9]+(?:[- ][a-z0-9]+)?", p)]
+    parts = []
+    for _ in range(rng.randint(1, 12)):
+        word = rng.choice(words)
+        parts.append(word.upper() if rng.random() < 0.3 else word)
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+@pytest.fixture(params=["hyperscan", "re"])
+def matchers(request):
+    """Peptide and condition matchers on the Hyperscan or re-only path."""
+    peptides = _FusedMatcher(PeptideEnricher.PEPTIDE_PATTERNS)
+    conditions = _FusedMatcher(PeptideEnricher.CONDITION_PATTERNS)
+    if request.param == "re":
+        peptides._scanner = conditions._scanner = None
+    return peptides, conditions
+
+
+class TestFusedMatcher:
+    """Tests that the fused matcher finds what the per-pattern loop did."""
+
+    @pytest.mark.parametrize("text", CASES)
+    def test_matches_baseline(self, matchers, text):
+        """Fixed cases, including names next to non-ASCII text."""
+        peptides, conditions = matchers
+        data = text.encode()
+
+        assert peptides.find(data) == baseline_find(PeptideEnricher.PEPTIDE_PATTERNS, text)
+        assert conditions.find(data) == baseline_find(PeptideEnricher.CONDITION_PATTERNS, text)
+
+    def test_name_glued_to_non_ascii_letter(self, matchers):
+        """A letter like 'é' continues the word, as with str \\b."""
+        peptides, conditions = matchers
+
+        assert peptides.find("tirzepatide-sermoreliné".encode()) == {"Tirzepatide"}
+        assert "healing" not in conditions.find("tendon injuryé".encode())
+
+    def test_name_next_to_non_ascii_punctuation(self, matchers):
+        """Curly quotes and dashes are still word boundaries."""
+        peptides, _ = matchers
+
+        assert peptides.find("Ozempic’s".encode()) == {"Semaglutide"}
+        assert peptides.find("BPC-157—".encode()) == {"BPC-157"}
+
+    def test_random_alias_soups(self, matchers):
+        """Seeded fuzz against the per-pattern loop."""
+        peptides, conditions = matchers
+        rng = random.Random(1234)
+        for _ in range(500):
+            for matcher, patterns in (
+                (peptides, PeptideEnricher.PEPTIDE_PATTERNS),
+                (conditions, PeptideEnricher.CONDITION_PATTERNS),
+            ):
+                text = alias_soup(rng, patterns)
+                assert matcher.find(text.encode()) == baseline_find(patterns, text), text
+
+
+class TestEnrich:
+    """Tests for single-chunk enrichment."""
+
+    def test_enrich_non_ascii_content(self):
+        """Names glued to non-ASCII letters should not be extracted."""
+        chunk = PeptideEnricher().enrich(
+            make_chunk("Semaglutide vs tirzepatide-sermoreliné for tendon injuryé")
+        )
+
+        assert sorted(chunk.peptides_mentioned) == ["Semaglutide", "Tirzepatide"]
+        assert "healing" not in chunk.conditions_mentioned
+
+    def test_enrich_cached_repeat(self):
+        """A repeated chunk should get the same metadata from the cache."""
+        enricher = PeptideEnricher()
+        first = enricher.enrich(make_chunk("BPC-157 for tendon healing"))
+        second = enricher.enrich(make_chunk("BPC-157 for tendon healing", chunk_id="c2"))
+
+        assert second.peptides_mentioned == first.peptides_mentioned == ["BPC-157"]
+        assert second.fda_status == first.fda_status
+        assert second.conditions_mentioned == first.conditions_mentioned
@@ -0,0 +1,189 @@
+"""
+Tests for batch indexing and duplicate tracking in the ingest script.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import scripts.ingest_all_sources as ingest_all_sources
+from scripts.ingest_all_sources import SeenContent, ingest_clinical_trials
+from models.documents import ProcessedChunk, SourceType
+from storage.weaviate_client import WeaviateClient
+
+
+def make_chunk(chunk_id: str) -> ProcessedChunk:
+    return ProcessedChunk(
+        chunk_id=chunk_id,
+        document_id=f"doc_{chunk_id}",
+        source_type=SourceType.CLINICALTRIALS,
+        content=f"content {chunk_id}",
+        title="Test chunk",
+        url="https://clinicaltrials.gov",
+    )
+
+
+class FakeCollection:
+    """Collection whose insert_many fails the given positions of each request."""
+
+    def __init__(self, fail_positions):
+        self.fail_positions = fail_positions
+        self.requests = []
+        self.data = self
+
+    def insert_many(self, objects):
+        self.requests.append(objects)
+        errors = {i: "vectorizer error" for i in self.fail_positions if i < len(objects)}
+        return SimpleNamespace(
+            has_errors=bool(errors),
+            errors=errors,
+            uuids={i: f"uuid-{i}" for i in range(len(objects)) if i not in errors},
+        )
+
+
+class FakeTrialsIngestion:
+    """ClinicalTrialsIngestion stand-in returning canned trials."""
+
+    contents = []
+
+    async def ingest_all_peptides(self):
+        return [
+            SimpleNamespace(nct_id=f"NCT{i}", phase="", conditions=[], sponsor="", start_date=None, content=content)
+            for i, content in enumerate(self.contents)
+        ]
+
+    def to_weaviate_format(self, trial):
+        return {
+            "content": trial.content,
+            "peptides": [],
+            "title": trial.nct_id,
+            "url": "https://clinicaltrials.gov",
+            "citation": trial.nct_id,
+        }
+
+    async def close(self):
+        pass
+
+
+class FakeWeaviate:
+    """Records each batch and fails positions, or raises, as configured."""
+
+    def __init__(self, failed=(), error=None):
+        self.failed = list(failed)
+        self.error = error
+        self.batches = []
+
+    async def index_chunks_batch(self, chunks):
+        self.batches.append([chunk.content for chunk in chunks])
+        if self.error:
+            raise self.error
+        return self.failed
+
+
+class TestSeenContent:
+    """Tests for SeenContent commit, discard and persistence."""
+
+    def test_partial_failure_leaves_failed_digests_unseen(self):
+        """Only chunks that indexed should be skipped next time."""
+        seen = SeenContent()
+        for content in ("a", "b", "c"):
+            assert seen.is_new(content)
+
+        seen.commit([1])
+
+        assert not seen.is_new("a")
+        assert seen.is_new("b")
+        assert not seen.is_new("c")
+
+    def test_discarded_batch_is_offered_again(self):
+        """A batch that raised should be retried."""
+        seen = SeenContent()
+        seen.is_new("a")
+
+        seen.discard()
+
+        assert seen.is_new("a")
+
+    def test_duplicate_within_batch_is_skipped(self):
+        """Pending content should not be offered twice."""
+        seen = SeenContent()
+
+        assert seen.is_new("a")
+        assert not seen.is_new("a")
+        assert seen.skipped == 1
+
+    def test_seen_file_round_trip(self, tmp_path):
+        """Committed digests should survive save and load; pending ones shouldn't."""
+        path = str(tmp_path / "seen")
+        seen = SeenContent(path)
+        seen.is_new("a")
+        seen.is_new("b")
+        seen.commit()
+        seen.is_new("c")
+        seen.save()
+
+        assert (tmp_path / "seen").stat().st_size == 2 * SeenContent.DIGEST_SIZE
+
+        reloaded = SeenContent(path)
+        assert not reloaded.is_new("a")
+        assert not reloaded.is_new("b")
+        assert reloaded.is_new("c")
+
+
+class TestIngestFlush:
+    """Tests for the batch flush in the ingest loops."""
+
+    @pytest.fixture(autouse=True)
+    def trials(self, monkeypatch):
+        monkeypatch.setattr(ingest_all_sources, "ClinicalTrialsIngestion", FakeTrialsIngestion)
+        monkeypatch.setattr(FakeTrialsIngestion, "contents", ["t0", "t1", "t1", "t2"])
+
+    @pytest.mark.asyncio
+    async def test_failed_positions_stay_unseen(self):
+        """Failed positions should map back to the right digests."""
+        seen = SeenContent()
+        weaviate = FakeWeaviate(failed=[1])
+
+        indexed = await ingest_clinical_trials(weaviate, seen=seen)
+
+        assert weaviate.batches == [["t0", "t1", "t2"]]
+        assert indexed == 2
+        assert not seen.is_new("t0")
+        assert seen.is_new("t1")
+        assert not seen.is_new("t2")
+
+    @pytest.mark.asyncio
+    async def test_raised_batch_is_discarded(self):
+        """A batch whose request raised should leave nothing marked seen."""
+        seen = SeenContent()
+
+        indexed = await ingest_clinical_trials(FakeWeaviate(error=RuntimeError("down")), seen=seen)
+
+        assert indexed == 0
+        assert all(seen.is_new(content) for content in ("t0", "t1", "t2"))
+
+
+class TestIndexChunksBatch:
+    """Tests for WeaviateClient.index_chunks_batch failure reporting."""
+
+    @pytest.mark.asyncio
+    async def test_reports_failed_positions_across_requests(self):
+        """Per-request error indices should map to positions in the input."""
+        collection = FakeCollection(fail_positions=[1])
+        client = WeaviateClient()
+        client._client = SimpleNamespace(collections=SimpleNamespace(get=lambda name: collection))
+        chunks = [make_chunk(str(i)) for i in range(5)]
+
+        failed = await client.index_chunks_batch(chunks, batch_size=2)
+
+        assert [len(objects) for objects in collection.requests] == [2, 2, 1]
+        assert failed == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_no_failures(self):
+        """A clean insert should report no failed positions."""
+        collection = FakeCollection(fail_positions=[])
+        client = WeaviateClient()
+        client._client = SimpleNamespace(collections=SimpleNamespace(get=lambda name: collection))
+
+        assert await client.index_chunks_batch([make_chunk("0")]) == []
@@ -0,0 +1,131 @@
+"""
+Tests for the ingestion pipeline.
+
+Runs IngestionPipeline against the mock vector store; chunking and
+enrichment are real.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from api.tests.mocks import MockVectorStore
+from models.documents import RawDocument, SourceType
+from processing.chunker import SimpleChunker
+from processing.enricher import PeptideEnricher
+from processing.pipeline import IngestionPipeline
+
+
+SENTENCE = "BPC-157 improved tendon healing in rats after injury. "
+
+
+class FailingChunker(SimpleChunker):
+    """Chunker that fails on documents whose id starts with 'bad-chunk'."""
+
+    def chunk_document(self, doc):
+        if doc.source_id.startswith("bad-chunk"):
+            raise ValueError("unparseable document")
+        return super().chunk_document(doc)
+
+
+class FailingEnricher(PeptideEnricher):
+    """Enricher that fails on chunks containing 'POISON'."""
+
+    def enrich(self, chunk):
+        if "POISON" in chunk.content:
+            raise ValueError("bad chunk")
+        return super().enrich(chunk)
+
+
+def make_doc(source_id: str, sentences: int = 40, extra: str = "") -> RawDocument:
+    return RawDocument(
+        source_id=source_id,
+        source_type=SourceType.PUBMED,
+        title=f"Paper {source_id}",
+        content=SENTENCE * sentences + extra,
+        url=f"https://pubmed.ncbi.nlm.nih.gov/{source_id}",
+    )
+
+
+BATCHES = [
+    [make_doc("p1"), make_doc("p2", sentences=5), make_doc("bad-chunk-1")],
+    [make_doc("p3", extra="POISON"), make_doc("p4", sentences=80)],
+    [make_doc("p5")],
+]
+
+
+async def stream_batches():
+    for batch in BATCHES:
+        yield batch
+
+
+def serial_stats():
+    """Stats from chunking and enriching document by document, in order."""
+    chunker, enricher = FailingChunker(), FailingEnricher()
+    stats = {"documents_processed": 0, "chunks_created": 0, "errors": 0}
+    chunk_ids = []
+    for batch in BATCHES:
+        for doc in batch:
+            try:
+                enriched = enricher.enrich_batch(chunker.chunk_document(doc))
+            except ValueError:
+                stats["errors"] += 1
+                continue
+            stats["documents_processed"] += 1
+            stats["chunks_created"] += len(enriched)
+            chunk_ids.extend(chunk.chunk_id for chunk in enriched)
+    return stats, chunk_ids
+
+
+class TestIngestDocuments:
+    """Tests for batch processing overlapped with indexing."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = MockVectorStore()
+        store.indexed_at = []
+        index = store.index_chunks_batch
+
+        async def index_chunks_batch(chunks):
+            failed = await index(chunks)
+            store.indexed_at.append(datetime.utcnow())
+            return failed
+
+        monkeypatch.setattr(store, "index_chunks_batch", index_chunks_batch)
+        return store
+
+    @pytest.fixture
+    def pipeline(self, store):
+        return IngestionPipeline(
+            weaviate_client=store,
+            chunker=FailingChunker(),
+            enricher=FailingEnricher(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_every_batch_indexed_once(self, store, pipeline):
+        """Each batch's chunks should be indexed in exactly one request."""
+        await pipeline.ingest_documents(stream_batches())
+
+        requests = [c["chunk_ids"] for c in store.call_history if c["operation"] == "index_chunks_batch"]
+        assert len(requests) == len(BATCHES)
+        assert [chunk_id for request in requests for chunk_id in request] == serial_stats()[1]
+
+    @pytest.mark.asyncio
+    async def test_last_batch_drained_before_end(self, store, pipeline):
+        """Ingestion should not finish while a batch is still indexing."""
+        stats = await pipeline.ingest_documents(stream_batches())
+
+        assert len(store.indexed_at) == len(BATCHES)
+        assert max(store.indexed_at) <= stats["end_time"]
+        assert pipeline._indexing is None
+
+    @pytest.mark.asyncio
+    async def test_stats_match_serial_processing(self, pipeline):
+        """Per-document error counting should match the serial version."""
+        stats = await pipeline.ingest_documents(stream_batches())
+        expected, chunk_ids = serial_stats()
+
+        assert {key: stats[key] for key in expected} == expected
+        assert expected["errors"] == 2  # One bad chunking, one bad enrichment
+        assert stats["chunks_indexed"] == len(chunk_ids)
@@ -0,0 +1,238 @@
+"""
+Tests for the RAG pipeline.
+
+Runs RAGPipeline end to end against the mock LLM client and vector
+store; no network calls are made.
+"""
+
+import asyncio
+
+import pytest
+
+from api.tests.mocks import MockLLMClient, MockVectorStore
+from llm.rag_pipeline import RAGPipeline, _inflight, filter_token_stream
+from llm.semantic_cache import SemanticCache
+from llm.embedding_cache import EmbeddingCache
+from storage.weaviate_client import VECTORIZER_MODEL
+
+
+# Follow-up turns are never served from the semantic cache
+HISTORY = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}]
+
+
+@pytest.fixture
+def llm():
+    return MockLLMClient(default_response="BPC-157 is a synthetic peptide.")
+
+
+@pytest.fixture
+def store():
+    store = MockVectorStore()
+    store.seed_chunks([{"id": "c1", "content": "BPC-157 research summary"}])
+    return store
+
+
+def make_pipeline(llm, store, **kwargs) -> RAGPipeline:
+    return RAGPipeline(
+        weaviate_client=store,
+        openai_client=llm,
+        model="mock-model",
+        **kwargs,
+        response_cache=SemanticCache(),
+        embedding_cache=EmbeddingCache(),
+    )
+
+
+class TestSingleFlight:
+    """Tests for coalescing identical in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_run(self, llm, store):
+        """Concurrent identical requests should run the pipeline once."""
+        results = await asyncio.gather(*[
+            make_pipeline(llm, store).generate_response("What is BPC-157?", conversation_history=HISTORY)
+            for _ in range(3)
+        ])
+
+        assert all(r is results[0] for r in results)
+        assert store.get_operation_count("hybrid_search") == 1
+        assert not _inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self, llm, store):
+        """Followers should take over when the first caller is cancelled."""
+        leader = asyncio.create_task(
+            make_pipeline(llm, store).generate_response("What is BPC-157?", conversation_history=HISTORY)
+        )
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(
+                make_pipeline(llm, store).generate_response("What is BPC-157?", conversation_history=HISTORY)
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert results[0] is results[1]
+        assert results[0]["response"] == "BPC-157 is a synthetic peptide."
+        assert store.get_operation_count("hybrid_search") == 2  # Leader's run + one takeover
+        assert not _inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_leaves_leader_running(self, llm, store):
+        """Cancelling a follower should not affect the shared run."""
+        leader = asyncio.create_task(
+            make_pipeline(llm, store).generate_response("What is BPC-157?", conversation_history=HISTORY)
+        )
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(
+            make_pipeline(llm, store).generate_response("What is BPC-157?", conversation_history=HISTORY)
+        )
+        await asyncio.sleep(0)
+
+        follower.cancel()
+        result = await leader
+
+        assert follower.cancelled()
+        assert result["response"] == "BPC-157 is a synthetic peptide."
+
+
+class TestSemanticCacheLookup:
+    """Tests for serving repeat questions from the semantic cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_generation(self, llm, store):
+        """A near-duplicate question should be answered without the LLM."""
+        rag = make_pipeline(llm, store)
+
+        first = await rag.generate_response("What is BPC-157?")
+        completions = len(llm.call_history)
+        second = await rag.generate_response("what is BPC-157")
+
+        assert "cache_hit" not in first["metadata"]
+        assert second["metadata"]["cache_hit"] is True
+        assert second["response"] == first["response"]
+        assert len(llm.call_history) == completions
+
+    @pytest.mark.asyncio
+    async def test_exact_repeat_skips_retrieval(self, llm, store):
+        """A repeat with a locally cached embedding should not query the vector store."""
+        rag = make_pipeline(llm, store)
+
+        await rag.generate_response("What is BPC-157?")
+        searches = store.get_operation_count("hybrid_search")
+        result = await rag.generate_response("What is BPC-157?")
+
+        assert result["metadata"]["cache_hit"] is True
+        assert store.get_operation_count("hybrid_search") == searches
+
+    @pytest.mark.asyncio
+    async def test_retrieval_overlaps_query_embedding(self, llm, store, monkeypatch):
+        """Retrieval should start before the embedding round trip completes."""
+        store.query_vector_model = "text-embedding-ada-002"  # Embedding not reusable
+        rag = make_pipeline(llm, store)
+        events = []
+
+        search, embed = store.hybrid_search, rag._embed_query
+
+        async def hybrid_search(*args, **kwargs):
+            events.append("search")
+            return await search(*args, **kwargs)
+
+        async def embed_query(query):
+            embedding = await embed(query)
+            events.append("embedded")
+            return embedding
+
+        monkeypatch.setattr(store, "hybrid_search", hybrid_search)
+        monkeypatch.setattr(rag, "_embed_query", embed_query)
+
+        await rag.generate_response("What is BPC-157?")
+
+        assert events == ["search", "embedded"]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_by_peptide(self, llm, store):
+        """A near-duplicate question about another peptide should miss."""
+        rag = make_pipeline(llm, store)
+        question = "What is {} used for in tendon healing research and how does it compare to other options today"
+
+        await rag.generate_response(question.format("BPC-157"))
+        result = await rag.generate_response(question.format("TB-500"))
+
+        assert "cache_hit" not in result["metadata"]
+        assert result["classification"]["peptides"] == ["TB-500"]
+
+
+class TestQueryVectors:
+    """Tests for reusing the query embedding in hybrid search."""
+
+    def last_search_vector(self, store):
+        return [c for c in store.call_history if c["operation"] == "hybrid_search"][-1]["vector"]
+
+    @pytest.mark.asyncio
+    async def test_vector_passed_when_models_match(self, llm, store):
+        """The embedding should be sent when the collections use its model."""
+        store.query_vector_model = VECTORIZER_MODEL
+
+        await make_pipeline(llm, store).generate_response("What is BPC-157?")
+
+        assert self.last_search_vector(store) is not None
+
+    @pytest.mark.asyncio
+    async def test_vector_withheld_when_models_differ(self, llm, store):
+        """Weaviate should vectorize the query when the models differ."""
+        store.query_vector_model = "text-embedding-ada-002"
+
+        await make_pipeline(llm, store).generate_response("What is BPC-157?")
+
+        assert self.last_search_vector(store) is None
+
+    @pytest.mark.asyncio
+    async def test_no_embedding_model_skips_embedding(self, llm, store):
+        """Providers without an embedding model should not call the API."""
+        store.query_vector_model = VECTORIZER_MODEL
+        rag = make_pipeline(llm, store, embedding_model=None)
+
+        await rag.generate_response("What is BPC-157?")
+        result = await rag.generate_response("What is BPC-157?")
+
+        assert llm.embedding_calls == []
+        assert self.last_search_vector(store) is None
+        assert "cache_hit" not in result["metadata"]
+
+
+async def stream_of(tokens):
+    for token in tokens:
+        yield token
+
+
+class TestFilterTokenStream:
+    """Tests for the line-buffered safety filter on streamed tokens."""
+
+    @pytest.mark.asyncio
+    async def test_matches_whole_response_filter(self, llm, store):
+        """Vendor text split across tokens should be removed as in the full response."""
+        text = "BPC-157 is studied.\nYou can buy it from a vendor.\nSee www.example.com today"
+        tokens = [text[i:i + 3] for i in range(0, len(text), 3)]
+
+        streamed = "".join([part async for part in filter_token_stream(stream_of(tokens))])
+
+        assert streamed == make_pipeline(llm, store)._apply_safety_filter(text, None)
+        assert "vendor information removed" in streamed
+        assert "www.example.com" not in streamed
+
+    @pytest.mark.asyncio
+    async def test_completed_lines_released_early(self):
+        """Each line should be released as soon as it is complete."""
+        async def tokens():
+            yield "First line\nSec"
+            raise AssertionError("the first line should not wait for more tokens")
+
+        stream = filter_token_stream(tokens())
+
+        assert await stream.__anext__() == "First line\n"
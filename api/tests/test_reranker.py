@@ -0,0 +1,76 @@
+"""
+Tests for the cross-encoder context reranker.
+
+The model is replaced by a scorer with fixed outputs, so
+sentence-transformers is not needed to run these.
+"""
+
+import pytest
+
+from llm.reranker import CrossEncoderReranker
+
+
+class KeywordScorer:
+    """Scores a pair by how often the keyword appears in the passage."""
+
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.batches = []
+
+    def predict(self, pairs):
+        self.batches.append(pairs)
+        return [passage.count(self.keyword) for _, passage in pairs]
+
+
+def doc(content: str = "", **props) -> dict:
+    return {"properties": {"content": content, **props}}
+
+
+@pytest.fixture
+def reranker():
+    reranker = CrossEncoderReranker(max_chars=20)
+    reranker._model = KeywordScorer("bpc")
+    return reranker
+
+
+class TestCrossEncoderReranker:
+    """Tests for CrossEncoderReranker."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_top_k_by_score(self, reranker):
+        """Docs should come back in score order, cut to top_k."""
+        docs = [doc("tb"), doc("bpc bpc bpc"), doc("bpc"), doc("bpc bpc")]
+
+        ranked = await reranker.rerank("query", docs, top_k=2)
+
+        assert ranked == [docs[1], docs[3]]
+
+    @pytest.mark.asyncio
+    async def test_scores_in_one_batch(self, reranker):
+        """All pairs should go to the model in a single predict call."""
+        await reranker.rerank("query", [doc("a"), doc("b"), doc("c")], top_k=1)
+
+        assert len(reranker._model.batches) == 1
+        assert [q for q, _ in reranker._model.batches[0]] == ["query"] * 3
+
+    @pytest.mark.asyncio
+    async def test_skips_model_when_nothing_to_drop(self, reranker):
+        """No inference should run when all docs fit in top_k."""
+        docs = [doc("a"), doc("b")]
+
+        assert await reranker.rerank("query", docs, top_k=2) is docs
+        assert reranker._model.batches == []
+
+    @pytest.mark.asyncio
+    async def test_passage_fallbacks_and_truncation(self, reranker):
+        """Outcomes and titles should be scored, truncated to max_chars."""
+        docs = [
+            {"properties": {"outcome_narrative": "bpc " * 10}},
+            {"properties": {"title": "bpc"}},
+            {"properties": {}},
+        ]
+
+        await reranker.rerank("query", docs, top_k=1)
+
+        passages = [p for _, p in reranker._model.batches[0]]
+        assert passages == [("bpc " * 10)[:20], "bpc", ""]
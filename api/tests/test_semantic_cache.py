@@ -0,0 +1,81 @@
+"""
+Tests for the semantic response cache.
+"""
+
+import pytest
+
+from llm.query_classifier import QueryType
+from llm.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache lookups, scoping and eviction."""
+
+    @pytest.fixture
+    def cache(self):
+        return SemanticCache(max_entries=3)
+
+    def test_near_duplicate_hits(self, cache):
+        """A vector close to a stored one should return its payload."""
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+
+        assert cache.get([1.0, 0.05, 0.0], "ns") == {"response": "a"}
+
+    def test_dissimilar_query_misses(self, cache):
+        """A vector below the similarity threshold should miss."""
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+
+        assert cache.get([1.0, 1.0, 0.0], "ns") is None
+
+    def test_closest_entry_wins(self, cache):
+        """The best-scoring entry should be returned."""
+        cache.put([1.0, 0.1, 0.0], "ns", {"response": "a"})
+        cache.put([1.0, 0.0, 0.1], "ns", {"response": "b"})
+
+        assert cache.get([1.0, 0.0, 0.09], "ns") == {"response": "b"}
+
+    def test_namespaces_are_isolated(self, cache):
+        """An identical vector in another namespace should miss."""
+        cache.put([1.0, 0.0, 0.0], "gpt-4o:balanced:dosing:bpc-157", {"response": "a"})
+
+        assert cache.get([1.0, 0.0, 0.0], "gpt-4o:balanced:dosing:tb-500") is None
+        assert cache.get([1.0, 0.0, 0.0], "gpt-4o:balanced:safety:bpc-157") is None
+
+    def test_dosing_threshold_is_stricter(self, cache):
+        """Dosing queries should need a closer match than the default."""
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+        query = [1.0, 0.3, 0.0]  # cosine ~0.958
+
+        assert cache.get(query, "ns") is not None
+        assert cache.get(query, "ns", QueryType.DOSING) is None
+
+    def test_evicts_least_recently_used(self, cache):
+        """When full, the least recently used entry should be dropped."""
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+        cache.put([0.0, 1.0, 0.0], "ns", {"response": "b"})
+        cache.put([0.0, 0.0, 1.0], "other", {"response": "c"})
+        cache.get([1.0, 0.0, 0.0], "ns")  # Touch "a"
+
+        cache.put([1.0, 1.0, 0.0], "ns", {"response": "d"})
+
+        assert len(cache) == 3
+        assert cache.get([0.0, 1.0, 0.0], "ns") is None
+        assert cache.get([1.0, 0.0, 0.0], "ns") == {"response": "a"}
+        assert cache.get([1.0, 1.0, 0.0], "ns") == {"response": "d"}
+        assert cache.get([0.0, 0.0, 1.0], "other") == {"response": "c"}
+
+    def test_expired_entries_miss(self):
+        """Entries older than the TTL should not be returned."""
+        cache = SemanticCache(ttl_seconds=-1)
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+
+        assert cache.get([1.0, 0.0, 0.0], "ns") is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache):
+        """clear() should drop every entry."""
+        cache.put([1.0, 0.0, 0.0], "ns", {"response": "a"})
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get([1.0, 0.0, 0.0], "ns") is None
@@ -150,7 +150,10 @@ async def cmd_test_pubmed(args):
     query = args.query or "BPC-157"
     print(f"\n🔬 Testing PubMed search: '{query}'")
 
-    docs = await adapter.search(query, max_results=args.max)
+    try:
+        docs = await adapter.search(query, max_results=args.max)
+    finally:
+        await adapter.close()
 
     print(f"   Found {len(docs)} papers\n")
 
@@ -165,7 +168,7 @@ async def cmd_test_pubmed(args):
 async def cmd_ingest_reddit(args):
     """Ingest Reddit data into Weaviate"""
     from sources.reddit_ingestion import RedditIngestion
-    from storage.weaviate_client import WeaviateClient
+    from storage.weaviate_client import WeaviateClient, INDEX_BATCH_SIZE
     from processing.chunker import SimpleChunker
     from models.documents import RawDocument, SourceType
 
@@ -191,9 +194,19 @@ async def cmd_ingest_reddit(args):
         print(f"\n📊 Fetched {len(posts)} Reddit posts/comments")
         print(f"   Experience reports: {sum(1 for p in posts if p.is_experience_report)}")
 
-        # Convert and store in Weaviate
+        # Convert and store in Weaviate, one insert_many per full buffer
         chunks_stored = 0
         errors = 0
+        pending = []
+
+        async def flush():
+            nonlocal chunks_stored, errors
+            try:
+                chunks_stored += len(pending) - len(await weaviate.index_chunks_batch(pending))
+            except Exception as e:
+                logger.error(f"Error storing batch of {len(pending)} chunks: {e}")
+                errors += 1
+            pending.clear()
 
         for post in posts:
             try:
@@ -209,22 +222,22 @@ async def cmd_ingest_reddit(args):
                     citation=f"Reddit r/{post.subreddit} - u/{post.author} ({post.created_utc.strftime('%Y-%m-%d')})",
                 )
 
-                # Chunk the document
-                chunks = chunker.chunk_document(raw_doc)
-
-                # Enrich and store chunks
-                for chunk in chunks:
+                # Chunk the document and enrich chunks
+                for chunk in chunker.chunk_document(raw_doc):
                     # Add peptide mentions from post
                     chunk.peptides_mentioned = post.peptides_mentioned
-
-                    # Store in Weaviate using index_chunk
-                    await weaviate.index_chunk(chunk)
-                    chunks_stored += 1
+                    pending.append(chunk)
 
             except Exception as e:
-                logger.error(f"Error storing post {post.id}: {e}")
+                logger.error(f"Error chunking post {post.id}: {e}")
                 errors += 1
 
+            if len(pending) >= INDEX_BATCH_SIZE:
+                await flush()
+
+        if pending:
+            await flush()
+
         print(f"\n✅ Reddit Ingestion Complete!")
         print(f"   Posts processed: {len(posts)}")
         print(f"   Chunks stored: {chunks_stored}")
@@ -0,0 +1,79 @@
+"""
+Peptide AI - Circuit Breaker
+
+Fails fast when an upstream provider (OpenAI, Ollama) is persistently down,
+instead of paying the full request timeout on every call.
+
+States:
+- CLOSED: calls pass through, consecutive failures are counted
+- OPEN: calls are rejected until reset_timeout has elapsed
+- HALF-OPEN: one trial call is let through while everyone else is still
+  rejected; success closes, failure re-opens. A trial that never reports
+  back (e.g. cancelled) is replaced after another reset_timeout.
+"""
+
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open breaker"""
+
+
+class CircuitBreaker:
+    """
+    Minimal consecutive-failure circuit breaker
+
+    Not tied to any client - callers invoke before_call(), then
+    record_success() or record_failure() around the guarded operation.
+    """
+
+    def __init__(self, name: str, fail_max: int = 10, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while the breaker is rejecting calls"""
+        if self._opened_at is None:
+            return False
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return True
+        # Half-open: only rejecting while a trial call is outstanding
+        return self._trial_started_at is not None and now - self._trial_started_at < self.reset_timeout
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls are currently short-circuited"""
+        if self.is_open:
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+        if self._opened_at is not None:
+            self._trial_started_at = time.monotonic()  # This caller is the half-open trial
+            logger.info(f"Circuit '{self.name}' half-open, letting a trial call through")
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call"""
+        if self._opened_at is not None:
+            logger.info(f"Circuit '{self.name}' closed")
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker once fail_max is reached"""
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            if not self.is_open:
+                logger.warning(
+                    f"Circuit '{self.name}' opened after {self._failures} failures "
+                    f"(reset in {self.reset_timeout:.0f}s)"
+                )
+            self._opened_at = time.monotonic()
+            self._trial_started_at = None
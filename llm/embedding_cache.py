@@ -0,0 +1,55 @@
+"""
+Peptide AI - Embedding Cache
+
+In-process LRU of text embeddings keyed by SHA-256 of the text, so the
+same query is only embedded once across turns and requests. Cached
+vectors are also handed to Weaviate, which then skips vectorizing the
+query server-side.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional, List, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """LRU cache of text -> embedding vector"""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Return the cached embedding for text, if any"""
+        key = self._key(text)
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return embedding
+
+    def put(self, text: str, embedding: List[float]):
+        """Store an embedding, evicting the least recently used if full"""
+        key = self._key(text)
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for monitoring"""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
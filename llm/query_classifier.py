@@ -9,10 +9,12 @@ Classifies user queries to determine:
 """
 
 import logging
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, TYPE_CHECKING
 from enum import Enum
 from pydantic import BaseModel
-import openai
+
+if TYPE_CHECKING:
+    import openai
 
 logger = logging.getLogger(__name__)
 
@@ -121,7 +123,7 @@ class QueryClassifier:
         "loading", "maintenance", "saturation",
     ]
 
-    def __init__(self, openai_client: Optional[openai.AsyncOpenAI] = None):
+    def __init__(self, openai_client: Optional["openai.AsyncOpenAI"] = None):
         self.openai_client = openai_client
 
     async def classify(self, query: str) -> QueryClassification:
@@ -10,167 +10,204 @@ Orchestrates the full retrieval-augmented generation flow:
 6. Disclaimer injection
 """
 
+import re
+import json
+import asyncio
+import time
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, AsyncIterator, Mapping
 import openai
-
+try:
+    import hyperscan
+except ImportError:  # Linux-only, optional
+    hyperscan = None
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random, retry_if_exception_type
+
+from llm.circuit_breaker import CircuitBreaker
+from llm.semantic_cache import SemanticCache
+from llm.embedding_cache import EmbeddingCache
+from llm.reranker import CrossEncoderReranker
 from llm.query_classifier import QueryClassifier, QueryClassification, QueryType, RiskLevel
 from llm.evidence_classifier import get_evidence_for_peptide, get_evidence_badge, enrich_context_with_evidence
-from storage.weaviate_client import WeaviateClient
+from storage.weaviate_client import WeaviateClient, VECTORIZER_MODEL
 
 logger = logging.getLogger(__name__)
 
+# Search parameters per strategy: (alpha, source_filter, include_outcomes, limit)
+_STRATEGY_PARAMS = {
+    "research_heavy": (0.6, "research", False, 8),        # More semantic
+    "experience_heavy": (0.4, "user_journeys", True, 6),  # More keyword
+    None: (0.5, None, True, 5),                           # Balanced
+}
+
+# Candidates fetched from Weaviate when a reranker narrows them down
+_RERANK_FETCH_LIMIT = 20
+
+# Transient provider errors worth retrying (429s, timeouts, 5xx)
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+# Structured output schema for follow-up questions (strict mode)
+_FOLLOWUPS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "followups",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "questions": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["questions"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Vendor recommendations stripped from responses by the safety filter.
+# None may match across a newline - filter_token_stream relies on it.
+_VENDOR_PATTERNS = [
+    r"you can buy.*from",
+    r"order from",
+    r"purchase at",
+    r"available at",
+    r"www\.[a-z]+\.com",
+]
+
+_VENDOR_RE = re.compile("|".join(f"(?:{p})" for p in _VENDOR_PATTERNS), re.IGNORECASE)
+_VENDOR_REPLACEMENT = "[vendor information removed - please research independently]"
+
+# Every vendor pattern contains one of these literals (casefolded)
+_VENDOR_TRIGGERS = ("buy", "order", "purchase", "available", "www.")
+
+
+def _compile_vendor_scanner():
+    """Compile the vendor patterns into one Hyperscan database, if available"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in _VENDOR_PATTERNS],
+            ids=list(range(len(_VENDOR_PATTERNS))),
+            elements=len(_VENDOR_PATTERNS),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_VENDOR_PATTERNS),
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan vendor scanner unavailable, using re only: {e}")
+        return None
 
-class RAGPipeline:
-    """
-    Main RAG pipeline for peptide queries
 
-    Handles the full flow from query to response with appropriate
-    context retrieval and safety measures.
-    """
+_vendor_scanner = _compile_vendor_scanner()
 
-    def __init__(
-        self,
-        weaviate_client: WeaviateClient,
-        openai_client: openai.AsyncOpenAI,
-        model: str = "gpt-4o"
-    ):
-        self.weaviate = weaviate_client
-        self.openai = openai_client
-        self.model = model
-        self.classifier = QueryClassifier(openai_client)
 
-    async def generate_response(
-        self,
-        query: str,
-        user_context: Optional[Dict[str, Any]] = None,
-        conversation_history: Optional[List[Dict[str, str]]] = None,
-        response_mode: str = "balanced"
-    ) -> Dict[str, Any]:
-        """
-        Generate a response to a user query
+def _stop_scan(*_args) -> bool:
+    return True  # Any match is enough, halt the scan
 
-        Args:
-            query: User's question
-            user_context: User's journey context for personalization
-            conversation_history: Previous messages in conversation
 
-        Returns:
-            Dict with response, sources, disclaimers, etc.
-        """
-        start_time = datetime.utcnow()
+def _might_contain_vendor_info(text: str) -> bool:
+    """
+    Cheap check for any vendor pattern
 
-        # 1. Classify the query
-        classification = await self.classifier.classify(query)
-        logger.info(f"Query classified as {classification.query_type.value} "
-                    f"(risk: {classification.risk_level.value})")
+    Most responses contain none, so the re.sub pass can be skipped
+    entirely. A plain substring scan for the trigger words rules out
+    almost everything; Hyperscan, when installed, confirms the rest.
+    """
+    folded = text.casefold()
+    if not any(trigger in folded for trigger in _VENDOR_TRIGGERS):
+        return False
+    if _vendor_scanner is None:
+        return True
+    try:
+        _vendor_scanner.scan(text.encode(), match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _strip_vendor_info(text: str) -> str:
+    """Replace any vendor recommendations in text"""
+    if not _might_contain_vendor_info(text):
+        return text
+    return _VENDOR_RE.sub(_VENDOR_REPLACEMENT, text)
+
+
+async def filter_token_stream(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Safety-filter a token stream, releasing it a line at a time
 
-        # 2. Handle blocked queries
-        if classification.risk_level == RiskLevel.BLOCKED:
-            return self._blocked_response(classification)
+    No vendor pattern matches across a newline, so filtering each
+    completed line gives the same text as filtering the whole response.
+    """
+    pending = ""
+    async for token in tokens:
+        pending += token
+        end = pending.rfind("\n") + 1
+        if end:
+            yield _strip_vendor_info(pending[:end])
+            pending = pending[end:]
+    if pending:
+        yield _strip_vendor_info(pending)
 
-        # 3. Retrieve context
-        context_docs = await self._retrieve_context(
-            query=query,
-            classification=classification,
-            user_context=user_context
-        )
 
-        # 4. Build the prompt (use response_mode if provided, otherwise infer from classification)
-        system_prompt = self._build_system_prompt(classification, user_context, response_mode)
-        context_prompt = self._build_context_prompt(
-            context_docs,
-            peptides_mentioned=classification.peptides_mentioned
-        )
+def _ms_since(start_ns: int) -> int:
+    """Whole milliseconds elapsed since a perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
 
-        # 5. Build conversation messages
-        messages = self._build_messages(
-            system_prompt=system_prompt,
-            context_prompt=context_prompt,
-            query=query,
-            conversation_history=conversation_history
-        )
 
-        # 6. Generate response
-        response_text = await self._generate(messages)
+# Fallback to generic but still useful questions
+_FALLBACK_FOLLOWUPS = (
+    "What's the typical protocol and dosing for this?",
+    "What side effects should I watch for?",
+    "How long until I might see results?",
+    "Can these peptides be combined with others?",
+)
 
-        # 7. Apply safety filtering
-        response_text = self._apply_safety_filter(response_text, classification)
+# Fixed disclaimer texts, keyed like QueryClassification.disclaimer_types
+_DISCLAIMERS: Mapping[str, str] = MappingProxyType({
+    "research_only": "This is for educational purposes only, not medical advice.",
+    "consult_professional": "Consult a healthcare professional before use.",
+    "dosing_individual": "Dosing is individual. Start low, monitor response.",
+    "sourcing_legal": "Verify peptide legality in your jurisdiction.",
+})
 
-        # 8. Add disclaimers (dynamic based on peptides mentioned)
-        disclaimers = self._get_disclaimers(classification, classification.peptides_mentioned)
+# Query-type disclaimers appended after the FDA warnings
+_TYPE_DISCLAIMERS: Mapping[QueryType, str] = MappingProxyType({
+    QueryType.DOSING: _DISCLAIMERS["dosing_individual"],
+    QueryType.SOURCING: _DISCLAIMERS["sourcing_legal"],
+})
 
-        # 9. Format sources
-        sources = self._format_sources(context_docs)
+# Shared across pipeline instances - a new RAGPipeline is built per request
+_llm_breaker = CircuitBreaker("llm", fail_max=10, reset_timeout=30)
 
-        # 10. Generate LLM-based follow-up suggestions
-        follow_ups = await self._generate_followups(query, response_text)
+# Responses for repeat/near-duplicate queries, shared across instances
+_response_cache = SemanticCache(max_entries=1000)
 
-        elapsed_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+# In-flight generate_response calls by request key (single-flight)
+_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
 
-        return {
-            "response": response_text,
-            "sources": sources,
-            "disclaimers": disclaimers,
-            "follow_up_questions": follow_ups,
-            "classification": {
-                "type": classification.query_type.value,
-                "risk_level": classification.risk_level.value,
-                "peptides": classification.peptides_mentioned,
-            },
-            "metadata": {
-                "model": self.model,
-                "context_chunks": len(context_docs),
-                "elapsed_ms": elapsed_ms
-            }
-        }
+# Query embeddings, reused across turns and requests
+_embedding_cache = EmbeddingCache(max_entries=10_000)
 
-    async def _retrieve_context(
-        self,
-        query: str,
-        classification: QueryClassification,
-        user_context: Optional[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Retrieve relevant context from vector store"""
-        # Determine search parameters based on classification
-        if classification.search_strategy == "minimal":
-            return []  # Sourcing queries get minimal context
+# LRU of query hash -> classification, also shared across instances
+_classification_cache: "OrderedDict[str, QueryClassification]" = OrderedDict()
+_CLASSIFICATION_CACHE_MAX = 2048
 
-        # Set alpha based on strategy
-        if classification.search_strategy == "research_heavy":
-            alpha = 0.6  # More semantic
-            source_filter = "research"
-            include_outcomes = False
-        elif classification.search_strategy == "experience_heavy":
-            alpha = 0.4  # More keyword
-            source_filter = "user_journeys"
-            include_outcomes = True
-        else:
-            alpha = 0.5
-            source_filter = None
-            include_outcomes = True
-
-        # Perform search
-        results = await self.weaviate.hybrid_search(
-            query=query,
-            limit=10,
-            alpha=alpha,
-            source_filter=source_filter,
-            peptide_filter=classification.peptides_mentioned if classification.peptides_mentioned else None,
-            include_outcomes=include_outcomes
-        )
 
-        return results
+# =============================================================================
+# SYSTEM PROMPT FRAGMENTS (static, assembled once at import)
+# =============================================================================
 
-    def _build_system_prompt(
-        self,
-        classification: QueryClassification,
-        user_context: Optional[Dict[str, Any]],
-        response_mode: str = "balanced"
-    ) -> str:
-        """Build the system prompt based on query type and response mode"""
-        base_prompt = """You are Peptide AI, an expert research assistant. Help users understand peptide research and protocols.
+_BASE_SYSTEM_PROMPT = """You are Peptide AI, an expert research assistant. Help users understand peptide research and protocols.
 
 ## YOUR APPROACH
 - Be direct and helpful - give specific peptide recommendations
@@ -286,68 +323,61 @@ One sentence disclaimer about research purposes.
 - NO walls of text - make it scannable
 
 """
-        # Add query-type specific instructions
-        type_instructions = {
-            QueryType.RESEARCH: """Focus on:
+
+# Query-type specific instructions
+_TYPE_INSTRUCTIONS = {
+    QueryType.RESEARCH: """Focus on:
 - Peer-reviewed studies with specific findings
 - Human vs animal study distinctions
 - Quality and size of research
 """,
-            QueryType.DOSING: """Focus on:
+    QueryType.DOSING: """Focus on:
 - Commonly researched protocol ranges
 - Timing (morning vs evening, with/without food)
 - Cycle lengths from studies
 - Starting dose recommendations
 """,
-            QueryType.SAFETY: """Focus on:
+    QueryType.SAFETY: """Focus on:
 - Known side effects (common vs rare)
 - Drug interactions
 - Contraindications
 - What to monitor
 """,
-            QueryType.SOURCING: """Focus on:
+    QueryType.SOURCING: """Focus on:
 - What to look for in quality (COAs, third-party testing)
 - Red flags to avoid
 - General sourcing best practices
 """,
-            QueryType.EXPERIENCE: """Focus on:
+    QueryType.EXPERIENCE: """Focus on:
 - What users commonly report
 - Typical timeline for results
 - Common adjustments people make
 - Range of experiences (not just positive)
 """,
-            QueryType.STACKING: """The user is asking about COMBINING peptides. Focus on:
+    QueryType.STACKING: """The user is asking about COMBINING peptides. Focus on:
 - Recommend a specific stack for their goals (2-3 peptides that work together)
 - Explain WHY these peptides synergize
 - Provide timing/protocol for the stack (e.g., "BPC-157 morning, TB-500 evening")
 - Note any interactions to be aware of
 - Give a "starter stack" vs "advanced stack" option if appropriate
 """,
-            QueryType.GENERAL: """The user needs guidance. Focus on:
+    QueryType.GENERAL: """The user needs guidance. Focus on:
 - Identify the TOP peptides for their stated goals
 - If they mention multiple goals (weight + energy + sleep), address EACH with specific peptides
 - Suggest a practical starting point
 - Be enthusiastic and helpful - they came here for peptide guidance!
 """,
-        }
+}
 
-        prompt = base_prompt + type_instructions.get(classification.query_type, "")
+# Base prompt with type instructions already appended
+_PROMPT_BY_TYPE = {
+    query_type: _BASE_SYSTEM_PROMPT + instructions
+    for query_type, instructions in _TYPE_INSTRUCTIONS.items()
+}
 
-        # Add user context if available
-        if user_context:
-            prompt += f"""
-USER CONTEXT:
-- Expertise level: {user_context.get('expertise_level', 'unknown')}
-- Primary goals: {', '.join(user_context.get('primary_goals', []))}
-- Past experience: {', '.join(user_context.get('past_peptides', []))}
-- Known sensitivities: {', '.join(user_context.get('reported_sensitivities', []))}
-
-Tailor your response to their experience level and goals.
-"""
-
-        # Add response mode specific modifications
-        if response_mode == "skeptic":
-            prompt += """
+# Response mode specific modifications
+_MODE_INSTRUCTIONS = {
+    "skeptic": """
 
 ## SKEPTIC MODE ACTIVATED
 You are responding to a scientifically-minded user who wants EVIDENCE, not recommendations.
@@ -363,9 +393,8 @@ CRITICAL: For this user, you MUST:
 8. Answer the direct question first (YES/NO), then provide context
 9. Include study limitations: sample size, control groups, blinding
 10. Discuss publication bias and lack of negative study publication
-"""
-        elif response_mode == "actionable":
-            prompt += """
+""",
+    "actionable": """
 
 ## ACTIONABLE MODE ACTIVATED
 User wants quick, practical protocols. Be concise:
@@ -375,9 +404,8 @@ User wants quick, practical protocols. Be concise:
 - Mention reconstitution details if relevant
 - One brief disclaimer at the end
 - Format: numbered steps they can follow today
-"""
-        else:  # balanced mode (default)
-            prompt += """
+""",
+    "balanced": """
 
 ## BALANCED MODE
 Provide comprehensive but digestible information:
@@ -387,9 +415,376 @@ Provide comprehensive but digestible information:
 - Balance optimism with appropriate caution
 - Include cost context when relevant
 - Suggest what to try first and why
-"""
+""",
+}
+
+
+class RAGPipeline:
+    """
+    Main RAG pipeline for peptide queries
+
+    Handles the full flow from query to response with appropriate
+    context retrieval and safety measures.
+    """
+
+    def __init__(
+        self,
+        weaviate_client: WeaviateClient,
+        openai_client: openai.AsyncOpenAI,
+        model: str = "gpt-4o",
+        embedding_model: Optional[str] = VECTORIZER_MODEL,
+        response_cache: Optional[SemanticCache] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        reranker: Optional[CrossEncoderReranker] = None
+    ):
+        self.weaviate = weaviate_client
+        self.openai = openai_client
+        self.model = model
+        self.embedding_model = embedding_model  # None: provider can't embed, no semantic cache
+        self.response_cache = response_cache if response_cache is not None else _response_cache
+        self.embedding_cache = embedding_cache if embedding_cache is not None else _embedding_cache
+        self.reranker = reranker
+        self._classifier: Optional[QueryClassifier] = None
+
+    @property
+    def classifier(self) -> QueryClassifier:
+        """Query classifier, built on first use (cached classifications skip it)"""
+        if self._classifier is None:
+            self._classifier = QueryClassifier(self.openai)
+        return self._classifier
 
-        return prompt
+    async def generate_response(
+        self,
+        query: str,
+        user_context: Optional[Dict[str, Any]] = None,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        response_mode: str = "balanced"
+    ) -> Dict[str, Any]:
+        """
+        Generate a response to a user query
+
+        Args:
+            query: User's question
+            user_context: User's journey context for personalization
+            conversation_history: Previous messages in conversation
+
+        Returns:
+            Dict with response, sources, disclaimers, etc.
+        """
+        # Identical requests already in flight share one pipeline run.
+        # No lock needed: the dict is only touched between awaits.
+        key = self._inflight_key(query, user_context, conversation_history, response_mode)
+        while (pending := _inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only our own cancellation propagates. If the leader was
+                # cancelled (e.g. its client disconnected), join whichever
+                # follower takes over, or take over ourselves.
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            result = await self._run_pipeline(
+                query=query,
+                user_context=user_context,
+                conversation_history=conversation_history,
+                response_mode=response_mode
+            )
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; the leader re-raises it
+            raise
+        finally:
+            if _inflight.get(key) is future:
+                del _inflight[key]
+
+    def _inflight_key(
+        self,
+        query: str,
+        user_context: Optional[Dict[str, Any]],
+        conversation_history: Optional[List[Dict[str, str]]],
+        response_mode: str
+    ) -> str:
+        """Key for coalescing requests that would produce the same response"""
+        payload = json.dumps(
+            [self.model, response_mode, query, user_context, conversation_history],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    async def _run_pipeline(
+        self,
+        query: str,
+        user_context: Optional[Dict[str, Any]],
+        conversation_history: Optional[List[Dict[str, str]]],
+        response_mode: str
+    ) -> Dict[str, Any]:
+        """Classify, retrieve, generate and filter one response"""
+        start_ns = time.perf_counter_ns()
+        timings: Dict[str, int] = {}  # Per-stage wall time, ms
+
+        # 1. Classify the query
+        classification = await self._classify(query)
+        timings["classify_ms"] = _ms_since(start_ns)
+        logger.info(f"Query classified as {classification.query_type.value} "
+                    f"(risk: {classification.risk_level.value})")
+
+        # 2. Handle blocked queries
+        if classification.risk_level == RiskLevel.BLOCKED:
+            return self._blocked_response(classification)
+
+        # Repeat questions are answered from the semantic cache, before any
+        # retrieval result is waited on
+        stage_ns = time.perf_counter_ns()
+        query_embedding = self.embedding_cache.get(query) if self.embedding_model else None
+
+        # Only first-turn, non-personalized queries are safe to share, and
+        # only between questions of the same type about the same peptides
+        cache_namespace = ":".join([
+            self.model,
+            response_mode,
+            classification.query_type.value,
+            ",".join(sorted(set(classification.peptides_mentioned))),
+        ])
+        cacheable = not user_context and not conversation_history
+        retrieve_task = None
+        if cacheable:
+            if query_embedding is None and self.embedding_model:
+                if not self._query_vector_reusable():
+                    # Weaviate vectorizes the query itself, so the search can
+                    # start alongside the embedding round trip; it runs on a
+                    # worker thread and is dropped on a hit
+                    retrieve_ns = time.perf_counter_ns()
+                    retrieve_task = asyncio.create_task(self._retrieve_context(
+                        query=query,
+                        classification=classification,
+                        user_context=user_context
+                    ))
+                try:
+                    query_embedding = await self._embed_query(query)
+                except asyncio.CancelledError:
+                    if retrieve_task is not None:
+                        retrieve_task.cancel()
+                    raise
+            if query_embedding is not None:
+                cached = self.response_cache.get(
+                    query_embedding, cache_namespace, classification.query_type
+                )
+                timings["cache_lookup_ms"] = _ms_since(stage_ns)
+                if cached is not None:
+                    logger.info("Semantic cache hit")
+                    if retrieve_task is not None:
+                        retrieve_task.cancel()
+                    metadata = {
+                        **cached["metadata"],
+                        "cache_hit": True,
+                        "elapsed_ms": _ms_since(start_ns),
+                        "timings": timings,
+                    }
+                    return {**cached, "metadata": metadata}
+
+        # 3. Retrieve context
+        if retrieve_task is None:
+            retrieve_ns = time.perf_counter_ns()
+            retrieve_task = asyncio.create_task(self._retrieve_context(
+                query=query,
+                classification=classification,
+                user_context=user_context,
+                query_vector=query_embedding
+            ))
+        context_docs = await retrieve_task
+        timings["retrieve_ms"] = _ms_since(retrieve_ns)  # Includes any overlapped cache lookup
+
+        stage_ns = time.perf_counter_ns()
+
+        # 4. Build the prompt (use response_mode if provided, otherwise infer from classification)
+        system_prompt = self._build_system_prompt(classification, response_mode)
+        context_prompt = self._build_user_context_prompt(user_context) + self._build_context_prompt(
+            context_docs,
+            peptides_mentioned=classification.peptides_mentioned
+        )
+
+        # 5. Build conversation messages
+        messages = self._build_messages(
+            system_prompt=system_prompt,
+            context_prompt=context_prompt,
+            query=query,
+            conversation_history=conversation_history
+        )
+        timings["prompt_ms"] = _ms_since(stage_ns)
+
+        # 6. Generate response
+        stage_ns = time.perf_counter_ns()
+        tokens = []
+        async for token in self._generate_stream(messages):
+            if not tokens:
+                timings["first_token_ms"] = _ms_since(start_ns)
+            tokens.append(token)
+        response_text = "".join(tokens)
+        timings["generate_ms"] = _ms_since(stage_ns)
+
+        # 7. Apply safety filtering
+        stage_ns = time.perf_counter_ns()
+        response_text = self._apply_safety_filter(response_text, classification)
+        timings["safety_filter_ms"] = _ms_since(stage_ns)
+
+        # 8. Add disclaimers (dynamic based on peptides mentioned)
+        disclaimers = self._get_disclaimers(classification, classification.peptides_mentioned)
+
+        # 9. Format sources
+        sources = self._format_sources(context_docs)
+
+        # 10. Generate LLM-based follow-up suggestions
+        stage_ns = time.perf_counter_ns()
+        follow_ups = await self._generate_followups(query, response_text)
+        timings["followups_ms"] = _ms_since(stage_ns)
+
+        elapsed_ms = _ms_since(start_ns)
+        logger.info(
+            f"Response generated in {elapsed_ms}ms "
+            + " ".join(f"{stage}={ms}" for stage, ms in timings.items()),
+            extra={"timings": timings, "elapsed_ms": elapsed_ms}
+        )
+
+        result = {
+            "response": response_text,
+            "sources": sources,
+            "disclaimers": disclaimers,
+            "follow_up_questions": follow_ups,
+            "classification": {
+                "type": classification.query_type.value,
+                "risk_level": classification.risk_level.value,
+                "peptides": classification.peptides_mentioned,
+            },
+            "metadata": {
+                "model": self.model,
+                "context_chunks": len(context_docs),
+                "elapsed_ms": elapsed_ms,
+                "timings": timings
+            }
+        }
+
+        if cacheable and query_embedding is not None:
+            self.response_cache.put(query_embedding, cache_namespace, result)
+
+        return result
+
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed the query for the semantic cache; None if unavailable"""
+        if not self.embedding_model:
+            return None
+        try:
+            response = await self.openai.embeddings.create(
+                model=self.embedding_model,
+                input=query,
+            )
+            embedding = response.data[0].embedding
+            self.embedding_cache.put(query, embedding)
+            return embedding
+        except Exception as e:
+            logger.debug(f"Query embedding failed, skipping semantic cache: {e}")
+            return None
+
+    async def _classify(self, query: str) -> QueryClassification:
+        """Classify a query, reusing the result for repeated queries"""
+        # The classifier only looks at the lowercased query
+        key = hashlib.sha256(query.lower().encode()).hexdigest()
+
+        cached = _classification_cache.get(key)
+        if cached is not None:
+            _classification_cache.move_to_end(key)
+            return cached
+
+        classification = await self.classifier.classify(query)
+        _classification_cache[key] = classification
+        if len(_classification_cache) > _CLASSIFICATION_CACHE_MAX:
+            _classification_cache.popitem(last=False)
+        return classification
+
+    def _query_vector_reusable(self) -> bool:
+        """Whether query embeddings live in the same space as the collections"""
+        return bool(self.embedding_model) and self.embedding_model == self.weaviate.query_vector_model
+
+    async def _retrieve_context(
+        self,
+        query: str,
+        classification: QueryClassification,
+        user_context: Optional[Dict[str, Any]],
+        query_vector: Optional[List[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retrieve relevant context from vector store"""
+        # Determine search parameters based on classification
+        if classification.search_strategy == "minimal":
+            return []  # Sourcing queries get minimal context
+
+        # Set alpha based on strategy
+        alpha, source_filter, include_outcomes, limit = _STRATEGY_PARAMS.get(
+            classification.search_strategy, _STRATEGY_PARAMS[None]
+        )
+
+        # Same peptides in any order/multiplicity -> same filter
+        peptide_filter = sorted(set(classification.peptides_mentioned)) or None
+
+        # Perform search (over-fetch when a reranker will pick the best few)
+        results = await self.weaviate.hybrid_search(
+            query=query,
+            limit=_RERANK_FETCH_LIMIT if self.reranker else limit,
+            alpha=alpha,
+            source_filter=source_filter,
+            peptide_filter=peptide_filter,
+            include_outcomes=include_outcomes,
+            vector=query_vector if self._query_vector_reusable() else None
+        )
+
+        if self.reranker and len(results) > limit:
+            try:
+                return await self.reranker.rerank(query, results, top_k=limit)
+            except Exception as e:
+                logger.warning(f"Rerank failed, using search order: {e}")
+
+        return results[:limit]
+
+    def _build_system_prompt(
+        self,
+        classification: QueryClassification,
+        response_mode: str = "balanced"
+    ) -> str:
+        """
+        Build the system prompt based on query type and response mode
+
+        Contains nothing request-specific, so it is byte-identical for every
+        request with the same type and mode and OpenAI can serve it from
+        its prompt cache.
+        """
+        # Base + type instructions are prebuilt per query type
+        return (
+            _PROMPT_BY_TYPE.get(classification.query_type, _BASE_SYSTEM_PROMPT)
+            + _MODE_INSTRUCTIONS.get(response_mode, _MODE_INSTRUCTIONS["balanced"])
+        )
+
+    def _build_user_context_prompt(self, user_context: Optional[Dict[str, Any]]) -> str:
+        """Build the per-user personalization block, if any"""
+        if not user_context:
+            return ""
+
+        return f"""USER CONTEXT:
+- Expertise level: {user_context.get('expertise_level', 'unknown')}
+- Primary goals: {', '.join(user_context.get('primary_goals', []))}
+- Past experience: {', '.join(user_context.get('past_peptides', []))}
+- Known sensitivities: {', '.join(user_context.get('reported_sensitivities', []))}
+
+Tailor your response to their experience level and goals.
+
+"""
 
     def _build_context_prompt(
         self,
@@ -402,13 +797,15 @@ Provide comprehensive but digestible information:
         # Add evidence quality for mentioned peptides
         if peptides_mentioned:
             sections.append("## EVIDENCE QUALITY (use these badges in your response):\n")
-            for peptide in peptides_mentioned[:5]:  # Limit to top 5
+            for peptide in islice(peptides_mentioned, 5):  # Limit to top 5
                 evidence = get_evidence_for_peptide(peptide)
                 badge = get_evidence_badge(evidence.level)
-                sections.append(f"**{peptide}**: {badge}")
-                sections.append(f"  - Human studies: {evidence.human_studies}, Animal: {evidence.animal_studies}")
-                sections.append(f"  - FDA: {evidence.fda_status}")
-                sections.append(f"  - {evidence.summary}\n")
+                sections.append(
+                    f"**{peptide}**: {badge}\n"
+                    f"  - Human studies: {evidence.human_studies}, Animal: {evidence.animal_studies}\n"
+                    f"  - FDA: {evidence.fda_status}\n"
+                    f"  - {evidence.summary}\n"
+                )
 
         if not context_docs:
             sections.append("\nNo specific research context available for this query.")
@@ -416,16 +813,14 @@ Provide comprehensive but digestible information:
 
         sections.append("\n## RELEVANT RESEARCH CONTEXT:")
 
-        for i, doc in enumerate(context_docs[:10], 1):
+        for i, doc in enumerate(islice(context_docs, 10), 1):
             props = doc.get("properties", {})
-            collection = doc.get("collection", "unknown")
-            source_type = props.get('source_type', 'unknown').upper()
 
-            if collection == "PeptideChunk":
+            if doc.get("collection") == "PeptideChunk":
                 # Research document
                 sections.append(f"""
 [{i}] {props.get('title', 'Untitled')}
-Source: {source_type}
+Source: {props.get('source_type', 'unknown').upper()}
 Citation: {props.get('citation', 'N/A')}
 Content: {props.get('content', '')[:500]}...
 """)
@@ -448,8 +843,11 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
         conversation_history: Optional[List[Dict[str, str]]]
     ) -> List[Dict[str, str]]:
         """Build the message array for the API call"""
+        # Stable prompt first and on its own, so the cacheable prefix
+        # doesn't change with the retrieved context
         messages = [
-            {"role": "system", "content": system_prompt + "\n\n" + context_prompt}
+            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": context_prompt},
         ]
 
         # Add conversation history
@@ -465,19 +863,64 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
 
         return messages
 
-    async def _generate(self, messages: List[Dict[str, str]]) -> str:
-        """Generate response from LLM (OpenAI or Ollama)"""
+    async def _generate_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream response tokens from LLM (OpenAI or Ollama)"""
+        streamed = False
         try:
-            response = await self.openai.chat.completions.create(
+            stream = await self._create_completion(
                 model=self.model,
                 messages=messages,
                 temperature=0.7,
                 max_tokens=2000,
+                stream=True,
+                stream_options={"include_usage": True},
             )
-            return response.choices[0].message.content or ""
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    streamed = True
+                    yield chunk.choices[0].delta.content
+                elif getattr(chunk, "usage", None):
+                    self._log_prompt_cache_usage(chunk.usage)
         except Exception as e:
             logger.error(f"LLM generation failed ({self.model}): {e}")
-            return "I apologize, but I encountered an error generating a response. Please try again."
+            # Keep a partial answer; only substitute the apology if nothing arrived
+            if not streamed:
+                yield "I apologize, but I encountered an error generating a response. Please try again."
+
+    def _log_prompt_cache_usage(self, usage):
+        """Log how much of the prompt was served from OpenAI's prompt cache"""
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+        logger.debug(f"Prompt tokens: {usage.prompt_tokens} ({cached} cached)")
+
+    async def _create_completion(self, **kwargs):
+        """
+        Call the chat completions API behind the shared circuit breaker
+
+        Transient errors are retried with jittered backoff first; only a
+        call that still fails counts towards opening the breaker.
+        """
+        _llm_breaker.before_call()
+        try:
+            response = await self._create_completion_with_retry(**kwargs)
+        except _RETRYABLE_ERRORS:
+            _llm_breaker.record_failure()
+            raise
+        except openai.APIStatusError:
+            # The provider answered; only this request was rejected (4xx)
+            _llm_breaker.record_success()
+            raise
+        _llm_breaker.record_success()
+        return response
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.1, max=2.0) + wait_random(0, 0.1),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        reraise=True,
+    )
+    async def _create_completion_with_retry(self, **kwargs):
+        return await self.openai.chat.completions.create(**kwargs)
 
     def _apply_safety_filter(
         self,
@@ -486,24 +929,7 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
     ) -> str:
         """Apply safety filtering to response"""
         # Filter out any specific vendor recommendations that slipped through
-        vendor_patterns = [
-            r"you can buy.*from",
-            r"order from",
-            r"purchase at",
-            r"available at",
-            r"www\.[a-z]+\.com",
-        ]
-
-        import re
-        for pattern in vendor_patterns:
-            response = re.sub(
-                pattern,
-                "[vendor information removed - please research independently]",
-                response,
-                flags=re.IGNORECASE
-            )
-
-        return response
+        return _strip_vendor_info(response)
 
     def _get_disclaimers(
         self,
@@ -511,10 +937,8 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
         peptides: Optional[List[str]] = None
     ) -> List[str]:
         """Get dynamic disclaimers based on classification and mentioned peptides"""
-        disclaimers = []
-
         # Base disclaimer for all responses
-        disclaimers.append("This is for educational purposes only, not medical advice.")
+        disclaimers = [_DISCLAIMERS["research_only"]]
 
         # Add FDA-specific disclaimers based on peptides mentioned
         if peptides:
@@ -553,13 +977,11 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
 
         # Add query-type specific disclaimers
         if classification.risk_level == RiskLevel.HIGH:
-            disclaimers.append("Consult a healthcare professional before use.")
+            disclaimers.append(_DISCLAIMERS["consult_professional"])
 
-        if QueryType.DOSING in [classification.query_type]:
-            disclaimers.append("Dosing is individual. Start low, monitor response.")
-
-        if QueryType.SOURCING in [classification.query_type]:
-            disclaimers.append("Verify peptide legality in your jurisdiction.")
+        type_disclaimer = _TYPE_DISCLAIMERS.get(classification.query_type)
+        if type_disclaimer:
+            disclaimers.append(type_disclaimer)
 
         # Keep it to 3 max for clean UI
         return disclaimers[:3]
@@ -568,7 +990,7 @@ Summary: {props.get('outcome_narrative', '')[:300]}...
         """Format context docs as source citations"""
         sources = []
 
-        for doc in context_docs[:5]:  # Top 5 sources
+        for doc in islice(context_docs, 5):  # Top 5 sources
             props = doc.get("properties", {})
             sources.append({
                 "title": props.get("title", "Untitled"),
@@ -598,38 +1020,26 @@ Generate follow-up questions that:
 3. Explore related topics they might not have considered
 4. Are conversational and specific (not generic)
 
-Return ONLY a JSON array of 3-4 question strings. Example:
-["How should I time my BPC-157 doses around meals?", "What results do most people see in the first 2 weeks?", "Should I cycle off or can I use this continuously?"]"""
+Return 3-4 questions. Example:
+{{"questions": ["How should I time my BPC-157 doses around meals?", "What results do most people see in the first 2 weeks?", "Should I cycle off or can I use this continuously?"]}}"""
 
-            response_obj = await self.openai.chat.completions.create(
+            response_obj = await self._create_completion(
                 model="gpt-4o-mini",  # Use fast model for follow-ups
                 messages=[{"role": "user", "content": followup_prompt}],
                 temperature=0.7,
                 max_tokens=300,
+                response_format=_FOLLOWUPS_RESPONSE_FORMAT,
             )
 
-            import json
-            content = response_obj.choices[0].message.content or "[]"
-            # Clean up the response - extract JSON array
-            content = content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            follow_ups = json.loads(content)
-            if isinstance(follow_ups, list) and len(follow_ups) > 0:
+            # Structured output guarantees the schema, no fence stripping needed
+            content = response_obj.choices[0].message.content or "{}"
+            follow_ups = json.loads(content).get("questions", [])
+            if follow_ups:
                 return follow_ups[:4]
         except Exception as e:
             logger.warning(f"Failed to generate follow-ups: {e}")
 
-        # Fallback to generic but still useful questions
-        return [
-            "What's the typical protocol and dosing for this?",
-            "What side effects should I watch for?",
-            "How long until I might see results?",
-            "Can these peptides be combined with others?"
-        ]
+        return list(_FALLBACK_FOLLOWUPS)
 
     def _blocked_response(self, classification: QueryClassification) -> Dict[str, Any]:
         """Generate response for blocked queries"""
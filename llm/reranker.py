@@ -0,0 +1,52 @@
+"""
+Peptide AI - Context Reranker
+
+Optional local cross-encoder rerank of retrieved context. Lets the
+pipeline over-fetch candidates from Weaviate and keep only the few that
+actually answer the query, so fewer (and better) chunks reach the prompt.
+
+Requires sentence-transformers; the model is loaded lazily on first use.
+"""
+
+import asyncio
+import logging
+from typing import List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class CrossEncoderReranker:
+    """Scores (query, passage) pairs with a small cross-encoder"""
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        max_chars: int = 512
+    ):
+        self.model_name = model_name
+        self.max_chars = max_chars
+        self._model = None
+
+    def _get_model(self):
+        if self._model is None:
+            from sentence_transformers import CrossEncoder
+            self._model = CrossEncoder(self.model_name)
+            logger.info(f"Loaded reranker model {self.model_name}")
+        return self._model
+
+    @staticmethod
+    def _passage(doc: Dict[str, Any]) -> str:
+        props = doc.get("properties", {})
+        return props.get("content") or props.get("outcome_narrative") or props.get("title", "")
+
+    def _rerank_sync(self, query: str, docs: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        pairs = [(query, self._passage(doc)[:self.max_chars]) for doc in docs]
+        scores = self._get_model().predict(pairs)  # One batched inference
+        ranked = sorted(zip(scores, range(len(docs))), reverse=True)
+        return [docs[i] for _, i in ranked[:top_k]]
+
+    async def rerank(self, query: str, docs: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        """Return the top_k docs by cross-encoder score (inference runs off the event loop)"""
+        if len(docs) <= top_k:
+            return docs
+        return await asyncio.to_thread(self._rerank_sync, query, docs, top_k)
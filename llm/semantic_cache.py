@@ -0,0 +1,124 @@
+"""
+Peptide AI - Semantic Response Cache
+
+Short-circuits the RAG pipeline for repeat or near-duplicate questions.
+Queries are matched on cosine similarity of their embeddings. A hit
+returns the previously generated response without calling the LLM or
+waiting on Weaviate; any search started alongside the lookup is dropped.
+
+The cache is small and in-process, so a brute-force numpy scan over the
+stored (normalized) vectors is used instead of an ANN index. Vectors
+live in one preallocated matrix, a row per entry, written on put().
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any
+
+import numpy as np
+
+from llm.query_classifier import QueryType
+
+logger = logging.getLogger(__name__)
+
+
+# Minimum cosine similarity for a hit, stricter where wording matters
+DEFAULT_THRESHOLD = 0.92
+TYPE_THRESHOLDS = {
+    QueryType.DOSING: 0.96,
+    QueryType.SAFETY: 0.96,
+}
+
+
+class SemanticCache:
+    """
+    LRU cache of responses keyed by query embedding
+
+    Entries are scoped by a namespace (model, response mode, query type
+    and peptides) so a hit never crosses configurations or subjects that
+    would produce a different answer.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # row -> (namespace, payload, stored_at), least recently used first
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._rows_by_namespace: Dict[str, List[int]] = {}
+        self._free_rows = list(range(max_entries - 1, -1, -1))
+        self._matrix: Optional[np.ndarray] = None  # (max_entries, dim) unit vectors
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        embedding: List[float],
+        namespace: str,
+        query_type: Optional[QueryType] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached payload of the closest match above threshold"""
+        self._evict_expired()
+        rows = self._rows_by_namespace.get(namespace)
+        if not rows:
+            return None
+
+        query_vec = self._normalize(embedding)
+        if query_vec.shape[0] != self._matrix.shape[1]:
+            return None
+        if 3 * len(rows) < self.max_entries:
+            scores = self._matrix[rows] @ query_vec  # Gather just this namespace
+        else:
+            scores = (self._matrix @ query_vec)[rows]  # Cheaper than copying most rows
+        best = int(np.argmax(scores))
+
+        threshold = TYPE_THRESHOLDS.get(query_type, DEFAULT_THRESHOLD)
+        if scores[best] < threshold:
+            return None
+
+        row = rows[best]
+        self._entries.move_to_end(row)
+        return self._entries[row][1]
+
+    def put(self, embedding: List[float], namespace: str, payload: Dict[str, Any]):
+        """Store a payload, evicting the least recently used entry if full"""
+        vec = self._normalize(embedding)
+        if self._matrix is None or self._matrix.shape[1] != vec.shape[0]:
+            if self._matrix is not None:
+                logger.warning(f"Embedding size changed to {vec.shape[0]}, clearing semantic cache")
+            self.clear()
+            self._matrix = np.zeros((self.max_entries, vec.shape[0]), dtype=np.float32)
+
+        if not self._free_rows:
+            self._remove(next(iter(self._entries)))
+        row = self._free_rows.pop()
+
+        self._matrix[row] = vec
+        self._entries[row] = (namespace, payload, time.monotonic())
+        self._rows_by_namespace.setdefault(namespace, []).append(row)
+
+    def clear(self):
+        self._entries.clear()
+        self._rows_by_namespace.clear()
+        self._free_rows = list(range(self.max_entries - 1, -1, -1))
+
+    def _remove(self, row: int):
+        namespace = self._entries.pop(row)[0]
+        rows = self._rows_by_namespace[namespace]
+        rows.remove(row)
+        if not rows:
+            del self._rows_by_namespace[namespace]
+        self._free_rows.append(row)
+
+    def _evict_expired(self):
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [row for row, entry in self._entries.items() if entry[2] < cutoff]
+        for row in expired:
+            self._remove(row)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
@@ -1,7 +1,7 @@
 """
 Peptide AI - Core Data Models
 
-This module contains all Pydantic models for:
+This module contains the core data models for:
 - Raw documents from data sources
 - Processed chunks for vector storage
 - User journey tracking
@@ -9,11 +9,15 @@ This module contains all Pydantic models for:
 """
 
 from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 from enum import Enum
 from uuid import uuid4
 import hashlib
+from functools import lru_cache
+
+import numpy as np
 
 
 # =============================================================================
@@ -113,8 +117,14 @@ class RawDocument(BaseModel):
     raw_metadata: Dict[str, Any] = {}       # Source-specific metadata
 
 
-class ProcessedChunk(BaseModel):
-    """A chunk ready for embedding and storage"""
+@dataclass(slots=True, kw_only=True)
+class ProcessedChunk:
+    """
+    A chunk ready for embedding and storage
+
+    A slotted dataclass rather than a BaseModel: one is built per chunk
+    on the ingestion hot path, always from already-validated documents.
+    """
     chunk_id: str                           # Generated unique ID
     document_id: str                        # Parent document ID
     source_type: SourceType
@@ -122,13 +132,14 @@ class ProcessedChunk(BaseModel):
     section_type: Optional[str] = None      # abstract, methods, results, etc.
 
     # Enrichments
-    peptides_mentioned: List[str] = []
+    peptides_mentioned: List[str] = field(default_factory=list)
     fda_status: FDAStatus = FDAStatus.UNKNOWN
-    conditions_mentioned: List[str] = []
+    conditions_mentioned: List[str] = field(default_factory=list)
 
-    # Metadata
+    # Metadata - the chunkers pass the document's own objects, so all chunks
+    # of a document share one title/authors/citation; replace, don't mutate
     title: str
-    authors: List[str] = []
+    authors: List[str] = field(default_factory=list)
     publication_date: Optional[datetime] = None
     url: str
     doi: Optional[str] = None
@@ -136,8 +147,19 @@ class ProcessedChunk(BaseModel):
     original_language: str = "en"
 
     # Embeddings (populated after embedding step)
-    embedding_pubmedbert: Optional[List[float]] = None
-    embedding_openai: Optional[List[float]] = None
+    # Stored as float16 arrays - a quarter of the size of a List[float].
+    # Left out of ==: comparing ndarrays elementwise has no single truth value
+    embedding_pubmedbert: Optional[np.ndarray] = field(default=None, compare=False)
+    embedding_openai: Optional[np.ndarray] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        # Keep the coercions the BaseModel used to do (enum values are no-ops)
+        self.source_type = SourceType(self.source_type)
+        self.fda_status = FDAStatus(self.fda_status)
+        if self.embedding_pubmedbert is not None:
+            self.embedding_pubmedbert = np.asarray(self.embedding_pubmedbert, dtype=np.float16)
+        if self.embedding_openai is not None:
+            self.embedding_openai = np.asarray(self.embedding_openai, dtype=np.float16)
 
 
 # =============================================================================
@@ -179,7 +201,13 @@ class UserProfile(BaseModel):
 
     def get_anonymized_id(self) -> str:
         """Generate anonymized ID for data that gets shared/aggregated"""
-        return hashlib.sha256(f"{self.user_id}_pepper_xyz".encode()).hexdigest()[:16]
+        return _anonymize_user_id(self.user_id)
+
+
+@lru_cache(maxsize=4096)
+def _anonymize_user_id(user_id: str) -> str:
+    """Keyed on user_id (not the profile) so it stays correct if user_id changes"""
+    return hashlib.sha256(f"{user_id}_pepper_xyz".encode()).hexdigest()[:16]
 
 
 # =============================================================================
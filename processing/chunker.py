@@ -7,15 +7,89 @@ Uses semantic-aware chunking that respects section boundaries.
 
 import re
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import uuid4
 import hashlib
+from bisect import bisect_right
+from itertools import accumulate
+try:
+    import hyperscan
+except ImportError:  # Linux-only, optional
+    hyperscan = None
 
 from models.documents import RawDocument, ProcessedChunk, SourceType, FDAStatus
 
 logger = logging.getLogger(__name__)
 
 
+# Common section headings in research papers, one named group per section
+# type. The leading newline is a lookbehind so a heading's trailing
+# whitespace can't swallow the newline the next heading needs.
+_SECTION_RE = re.compile(
+    r"(?:^|(?<=\n))(?:"
+    r"(?P<abstract>ABSTRACT|Abstract)"
+    r"|(?P<background>BACKGROUND|Background)"
+    r"|(?P<introduction>INTRODUCTION|Introduction)"
+    r"|(?P<methods>METHODS?|Methods?|MATERIALS? AND METHODS?)"
+    r"|(?P<results>RESULTS?|Results?)"
+    r"|(?P<discussion>DISCUSSION|Discussion)"
+    r"|(?P<conclusion>CONCLUSION|Conclusion|CONCLUSIONS|Conclusions)"
+    r")[:\s]*\n?"
+)
+
+# Blank line (possibly holding whitespace) between paragraphs
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+# Sentence end followed by a space (". ", "? ", "! "), written reversed
+_REVERSED_SENTENCE_END_RE = re.compile(r" [.?!]")
+
+# Same headings as a presence check (Hyperscan has no lookbehind or groups)
+_SECTION_HEADING_PATTERN = (
+    r"(?:^|\n)(?:ABSTRACT|Abstract|BACKGROUND|Background|INTRODUCTION|Introduction"
+    r"|METHODS?|Methods?|MATERIALS? AND METHODS?|RESULTS?|Results?"
+    r"|DISCUSSION|Discussion|CONCLUSIONS?|Conclusions?)"
+)
+
+
+def _compile_section_scanner():
+    """Compile the heading check into a Hyperscan database, if available"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_SECTION_HEADING_PATTERN.encode()],
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan section scanner unavailable, using re only: {e}")
+        return None
+
+
+_section_scanner = _compile_section_scanner()
+
+
+def _stop_scan(*_args) -> bool:
+    return True  # Any heading is enough, halt the scan
+
+
+def _might_have_sections(content: str) -> bool:
+    """
+    Single-pass Hyperscan check for any section heading
+
+    Posts, trial summaries and short abstracts usually have none, so the
+    re pass can be skipped. Without Hyperscan, always defer to the re pass.
+    """
+    if _section_scanner is None:
+        return True
+    try:
+        _section_scanner.scan(content.encode(), match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
 class PeptideChunker:
     """
     Chunks documents for vector storage
@@ -27,6 +101,8 @@ class PeptideChunker:
     - Paragraph-aware: doesn't split mid-sentence
     """
 
+    __slots__ = ("target_size", "overlap", "min_size")
+
     def __init__(
         self,
         target_size: int = 2000,  # characters
@@ -37,35 +113,32 @@ class PeptideChunker:
         self.overlap = overlap
         self.min_size = min_size
 
-    def chunk_document(self, doc: RawDocument) -> List[ProcessedChunk]:
+    def chunk_document(self, doc: RawDocument) -> Iterator[ProcessedChunk]:
         """
         Split a document into chunks
 
-        Returns list of ProcessedChunk objects ready for enrichment.
+        Yields ProcessedChunk objects ready for enrichment, one at a time,
+        so consumers can start on the first chunk before the last is cut.
         """
         content = doc.content.strip()
 
         if not content:
-            return []
+            return
 
         # Detect if content has section markers
         sections = self._detect_sections(content)
 
         if sections:
             # Chunk each section separately
-            chunks = []
             for section_type, section_content in sections:
-                section_chunks = self._chunk_text(
+                yield from self._chunk_text(
                     text=section_content,
                     doc=doc,
                     section_type=section_type
                 )
-                chunks.extend(section_chunks)
         else:
             # Chunk as single unit
-            chunks = self._chunk_text(text=content, doc=doc, section_type=None)
-
-        return chunks
+            yield from self._chunk_text(text=content, doc=doc, section_type=None)
 
     def _detect_sections(self, content: str) -> List[tuple]:
         """
@@ -75,29 +148,18 @@ class PeptideChunker:
         """
         sections = []
 
-        # Common section patterns in research papers
-        section_patterns = [
-            (r"(?:^|\n)(?:ABSTRACT|Abstract)[:\s]*\n?", "abstract"),
-            (r"(?:^|\n)(?:BACKGROUND|Background)[:\s]*\n?", "background"),
-            (r"(?:^|\n)(?:INTRODUCTION|Introduction)[:\s]*\n?", "introduction"),
-            (r"(?:^|\n)(?:METHODS?|Methods?|MATERIALS? AND METHODS?)[:\s]*\n?", "methods"),
-            (r"(?:^|\n)(?:RESULTS?|Results?)[:\s]*\n?", "results"),
-            (r"(?:^|\n)(?:DISCUSSION|Discussion)[:\s]*\n?", "discussion"),
-            (r"(?:^|\n)(?:CONCLUSION|Conclusion|CONCLUSIONS|Conclusions)[:\s]*\n?", "conclusion"),
-        ]
+        if not _might_have_sections(content):
+            return sections
 
-        # Find all section markers and their positions
-        markers = []
-        for pattern, section_type in section_patterns:
-            for match in re.finditer(pattern, content):
-                markers.append((match.start(), match.end(), section_type))
+        # Find all section markers and their positions (one pass, in order)
+        markers = [
+            (match.start(), match.end(), match.lastgroup)
+            for match in _SECTION_RE.finditer(content)
+        ]
 
         if not markers:
             return []
 
-        # Sort by position
-        markers.sort(key=lambda x: x[0])
-
         # Extract sections
         for i, (start, end, section_type) in enumerate(markers):
             # Section content goes from end of marker to start of next marker (or end)
@@ -117,61 +179,62 @@ class PeptideChunker:
         text: str,
         doc: RawDocument,
         section_type: Optional[str]
-    ) -> List[ProcessedChunk]:
+    ) -> Iterator[ProcessedChunk]:
         """
         Chunk a piece of text into overlapping segments
         """
-        chunks = []
+        chunk_index = 0
 
         # Split into paragraphs first
         paragraphs = self._split_paragraphs(text)
 
-        current_chunk = ""
-        current_start = 0
+        # cumulative[k] = total length of the first k paragraphs, so the run
+        # of paragraphs that fits a chunk is found by bisection
+        cumulative = [0, *accumulate(map(len, paragraphs))]
+        if not paragraphs:
+            return
 
-        for para in paragraphs:
-            # If adding this paragraph exceeds target, save current and start new
-            if len(current_chunk) + len(para) > self.target_size and current_chunk:
-                chunk = self._create_chunk(
-                    content=current_chunk.strip(),
-                    doc=doc,
-                    section_type=section_type,
-                    chunk_index=len(chunks)
-                )
-                if chunk:
-                    chunks.append(chunk)
+        start = 0
+        overlap_text = ""
+        while True:
+            # Take at least one paragraph, then as many more as fit the target
+            budget = cumulative[start] + self.target_size - len(overlap_text)
+            end = max(bisect_right(cumulative, budget) - 1, start + 1)
+            current_chunk = "".join([overlap_text, *paragraphs[start:end]])
 
-                # Start new chunk with overlap from previous
-                overlap_text = self._get_overlap(current_chunk)
-                current_chunk = overlap_text + para
-            else:
-                current_chunk += para
+            if end == len(paragraphs):
+                break
 
-        # Don't forget the last chunk
-        if current_chunk.strip():
             chunk = self._create_chunk(
                 content=current_chunk.strip(),
                 doc=doc,
                 section_type=section_type,
-                chunk_index=len(chunks)
+                chunk_index=chunk_index
             )
             if chunk:
-                chunks.append(chunk)
+                chunk_index += 1
+                yield chunk
+
+            # Start new chunk with overlap from previous
+            overlap_text = self._get_overlap(current_chunk)
+            start = end
 
-        return chunks
+        # Don't forget the last chunk
+        current_chunk = current_chunk.strip()
+        if current_chunk:
+            chunk = self._create_chunk(
+                content=current_chunk,
+                doc=doc,
+                section_type=section_type,
+                chunk_index=chunk_index
+            )
+            if chunk:
+                yield chunk
 
     def _split_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs, preserving paragraph breaks"""
         # Split on double newlines or single newlines followed by indent
-        paragraphs = re.split(r'\n\s*\n', text)
-
-        result = []
-        for p in paragraphs:
-            p = p.strip()
-            if p:
-                result.append(p + "\n\n")
-
-        return result
+        return [p + "\n\n" for p in map(str.strip, _PARAGRAPH_BREAK_RE.split(text)) if p]
 
     def _get_overlap(self, text: str) -> str:
         """Get the last N characters for overlap"""
@@ -181,13 +244,10 @@ class PeptideChunker:
         # Try to break at sentence boundary
         overlap_text = text[-self.overlap:]
 
-        # Find last sentence end in overlap
-        sentence_ends = [
-            overlap_text.rfind(". "),
-            overlap_text.rfind("? "),
-            overlap_text.rfind("! "),
-        ]
-        best_end = max(sentence_ends)
+        # Find last sentence end in overlap: the first match scanning the
+        # reversed text, one pass instead of an rfind per delimiter
+        match = _REVERSED_SENTENCE_END_RE.search(overlap_text[::-1])
+        best_end = len(overlap_text) - match.end() if match else -1
 
         if best_end > 0:
             return overlap_text[best_end + 2:]
@@ -229,8 +289,9 @@ class PeptideChunker:
 
     def _generate_chunk_id(self, doc_id: str, index: int, content: str) -> str:
         """Generate unique, deterministic chunk ID"""
-        # Hash the content for uniqueness
-        content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
+        # Hash the content for uniqueness (32 bits is plenty alongside doc_id
+        # and index, so ask blake2b for exactly that instead of truncating)
+        content_hash = hashlib.blake2b(content.encode(), digest_size=4).hexdigest()
         return f"{doc_id}_chunk_{index}_{content_hash}"
 
 
@@ -241,17 +302,19 @@ class SimpleChunker:
     Less sophisticated but faster for initial data loading.
     """
 
+    __slots__ = ("chunk_size", "overlap")
+
     def __init__(self, chunk_size: int = 1500, overlap: int = 150):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
-    def chunk_document(self, doc: RawDocument) -> List[ProcessedChunk]:
-        """Chunk document with simple fixed-size windows"""
+    def chunk_document(self, doc: RawDocument) -> Iterator[ProcessedChunk]:
+        """Chunk document with simple fixed-size windows, yielding as it goes"""
         content = doc.content.strip()
         if not content:
-            return []
+            return
 
-        chunks = []
+        chunk_index = 0
         start = 0
 
         while start < len(content):
@@ -274,8 +337,9 @@ class SimpleChunker:
             chunk_content = content[start:end].strip()
 
             if len(chunk_content) >= 50:  # Minimum chunk size
-                chunk_id = f"{doc.source_id}_c{len(chunks)}"
-                chunks.append(ProcessedChunk(
+                chunk_id = f"{doc.source_id}_c{chunk_index}"
+                chunk_index += 1
+                yield ProcessedChunk(
                     chunk_id=chunk_id,
                     document_id=doc.source_id,
                     source_type=doc.source_type,
@@ -289,8 +353,6 @@ class SimpleChunker:
                     peptides_mentioned=[],
                     fda_status=FDAStatus.UNKNOWN,
                     conditions_mentioned=[]
-                ))
+                )
 
             start = end - self.overlap
-
-        return chunks
@@ -8,13 +8,129 @@ Enriches chunks with:
 """
 
 import re
+import hashlib
 import logging
-from typing import List, Set
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import hyperscan
+except ImportError:  # Linux-only, optional
+    hyperscan = None
 
 from models.documents import ProcessedChunk, FDAStatus
 
 logger = logging.getLogger(__name__)
 
+# Chunks per task when enrich_batch maps over a process pool; batches
+# under two tasks' worth are enriched in-process
+POOL_CHUNKSIZE = 32
+
+
+def _bytes_pattern(pattern: str) -> bytes:
+    """
+    Encode a pattern for matching UTF-8 bytes
+
+    IGNORECASE on bytes only folds ASCII, so non-ASCII letters (the
+    β in tβ4) are spelled out in both cases.
+    """
+    return "".join(
+        f"(?:{c.lower()}|{c.upper()})" if not c.isascii() and c.lower() != c.upper() else c
+        for c in pattern
+    ).encode()
+
+
+def _collect_hit(pattern_id: int, _start: int, _end: int, _flags: int, hits: Set[int]) -> None:
+    hits.add(pattern_id)
+
+
+class _FusedMatcher:
+    """
+    All patterns of a table fused into one alternation, scanned once
+
+    The alternation consumes text, so a match can hide a pattern for a
+    different name that overlaps it ("tissue repair" is both "healing"
+    and "recovery"). Each distinct matched string is therefore re-checked
+    against the individual patterns once, and the names cached - the
+    vocabulary of matched strings is small.
+
+    Pure-ASCII text is scanned as bytes, which skips the Unicode paths in
+    the regex engine. With Hyperscan available the table is compiled into
+    one database for that instead; it reports every pattern that matches,
+    overlaps included, so no re-check is needed. \b on bytes sees every
+    non-ASCII byte as a non-word character (and Hyperscan has no Unicode
+    \b), so other text is scanned as str to keep Unicode word boundaries:
+    'sermoreliné' is not Sermorelin.
+    """
+
+    _MAX_CACHED = 4096
+
+    def __init__(self, patterns: Dict[str, str]):
+        alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+        if all(pattern.startswith(r"\b") for pattern in patterns):
+            # Hoist the shared leading \b so alternatives are only tried
+            # at word boundaries
+            alternation = r"\b(?:" + "|".join(
+                f"(?:{pattern[2:]})" for pattern in patterns
+            ) + ")"
+        self._bytes_regex = re.compile(_bytes_pattern(alternation), re.IGNORECASE)
+        self._text_regex = re.compile(alternation, re.IGNORECASE)
+        self._bytes_individual = [
+            (re.compile(_bytes_pattern(pattern), re.IGNORECASE), name)
+            for pattern, name in patterns.items()
+        ]
+        self._text_individual = [
+            (re.compile(pattern, re.IGNORECASE), name)
+            for pattern, name in patterns.items()
+        ]
+        self._names_by_match: Dict[Union[bytes, str], FrozenSet[str]] = {}
+        self._names = list(patterns.values())
+        self._scanner = self._compile_scanner(patterns)
+
+    @staticmethod
+    def _compile_scanner(patterns: Dict[str, str]):
+        """Compile the table into a Hyperscan database, if available"""
+        if hyperscan is None:
+            return None
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[_bytes_pattern(pattern) for pattern in patterns],
+                ids=list(range(len(patterns))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+            )
+            return db
+        except Exception as e:
+            logger.warning(f"Hyperscan enricher scanner unavailable, using re only: {e}")
+            return None
+
+    def find(self, data: bytes) -> Set[str]:
+        """Names of all patterns matching anywhere in UTF-8 data"""
+        if data.isascii():
+            if self._scanner is not None:
+                hits = set()
+                self._scanner.scan(data, match_event_handler=_collect_hit, context=hits)
+                return {self._names[i] for i in hits}
+            regex, individual = self._bytes_regex, self._bytes_individual
+        else:
+            data = data.decode()
+            regex, individual = self._text_regex, self._text_individual
+
+        found = set()
+        for match in regex.finditer(data):
+            matched = match.group().lower()
+            names = self._names_by_match.get(matched)
+            if names is None:
+                names = frozenset(
+                    name for pattern, name in individual if pattern.search(matched)
+                )
+                if len(self._names_by_match) < self._MAX_CACHED:
+                    self._names_by_match[matched] = names
+            found |= names
+        return found
+
 
 class PeptideEnricher:
     """
@@ -28,8 +144,8 @@ class PeptideEnricher:
 
     # Peptide name patterns and their canonical forms
     PEPTIDE_PATTERNS = {
-        # BPC-157 variants
-        r"\b(?:bpc[- ]?157|body protective compound[- ]?157)\b": "BPC-157",
+        # BPC-157 variants (the "157" is often dropped)
+        r"\b(?:bpc|body protective compound)(?:[- ]?157)?\b": "BPC-157",
 
         # TB-500 / Thymosin Beta-4
         r"\b(?:tb[- ]?500|thymosin[- ]?beta[- ]?4|tβ4)\b": "TB-500",
@@ -66,20 +182,19 @@ class PeptideEnricher:
 
         # Longevity
         r"\b(?:epitalon|epithalon)\b": "Epitalon",
-        r"\b(?:mots[- ]?c)\b": "MOTS-c",
+        r"\bmots[- ]?c\b": "MOTS-c",
         r"\b(?:ss[- ]?31|elamipretide)\b": "SS-31",
 
         # IGF/MGF
-        r"\b(?:igf[- ]?1(?:[- ]?lr3)?)\b": "IGF-1",
+        r"\bigf[- ]?1(?:[- ]?lr3)?\b": "IGF-1",
         r"\b(?:mgf|mechano[- ]?growth[- ]?factor)\b": "MGF",
 
         # Others
-        r"\b(?:aod[- ]?9604)\b": "AOD-9604",
+        r"\baod[- ]?9604\b": "AOD-9604",
         r"\bfollistatin\b": "Follistatin",
         r"\b(?:ll[- ]?37|cathelicidin)\b": "LL-37",
         r"\bkisspeptin\b": "Kisspeptin",
         r"\bpentosan\b": "Pentosan",
-        r"\b(?:bpc|body protective compound)\b": "BPC-157",
         r"\bthymosin\b": "Thymosin",
     }
 
@@ -119,6 +234,17 @@ class PeptideEnricher:
         "Kisspeptin": FDAStatus.INVESTIGATIONAL,
     }
 
+    # Most restrictive first; a chunk takes the lowest rank among its peptides
+    _STATUS_RANK = {
+        FDAStatus.BANNED_COMPOUNDING: 0,
+        FDAStatus.NOT_APPROVED: 1,
+        FDAStatus.INVESTIGATIONAL: 2,
+        FDAStatus.TRIAL: 3,
+        FDAStatus.APPROVED: 4,
+        FDAStatus.UNKNOWN: 5,
+    }
+    _RANK_STATUS = {rank: status for status, rank in _STATUS_RANK.items()}
+
     # Medical condition patterns
     CONDITION_PATTERNS = {
         r"\b(?:wound|injury|healing|tissue repair)\b": "healing",
@@ -145,16 +271,15 @@ class PeptideEnricher:
         r"\b(?:bone|osteo|fracture)\b": "bone health",
     }
 
-    def __init__(self):
-        # Compile patterns for efficiency
-        self._peptide_regex = {
-            re.compile(pattern, re.IGNORECASE): name
-            for pattern, name in self.PEPTIDE_PATTERNS.items()
-        }
-        self._condition_regex = {
-            re.compile(pattern, re.IGNORECASE): condition
-            for pattern, condition in self.CONDITION_PATTERNS.items()
-        }
+    def __init__(self, max_cached: int = 50_000):
+        # Shared, prebuilt at import - every enricher scans with the same tables
+        self._peptide_matcher = _PEPTIDE_MATCHER
+        self._condition_matcher = _CONDITION_MATCHER
+
+        # LRU of content digest -> (peptides, fda_status, conditions);
+        # boilerplate and quoted replies repeat across Reddit/PubMed chunks
+        self.max_cached = max_cached
+        self._cache: "OrderedDict[bytes, Tuple[Tuple[str, ...], FDAStatus, Tuple[str, ...]]]" = OrderedDict()
 
     def enrich(self, chunk: ProcessedChunk) -> ProcessedChunk:
         """
@@ -162,7 +287,19 @@ class PeptideEnricher:
 
         Modifies the chunk in place and returns it.
         """
-        content = chunk.content.lower()
+        # Patterns are compiled IGNORECASE, so no lowercased copy is needed;
+        # the UTF-8 encoding feeds both the cache key and the scans
+        content = chunk.content.encode()
+
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            peptides, fda_status, conditions = cached
+            chunk.peptides_mentioned = list(peptides)
+            chunk.fda_status = fda_status
+            chunk.conditions_mentioned = list(conditions)
+            return chunk
 
         # Extract peptides
         peptides = self._extract_peptides(content)
@@ -175,31 +312,43 @@ class PeptideEnricher:
         conditions = self._extract_conditions(content)
         chunk.conditions_mentioned = list(conditions)
 
-        return chunk
+        self._cache[key] = (
+            tuple(chunk.peptides_mentioned), chunk.fda_status, tuple(chunk.conditions_mentioned)
+        )
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
 
-    def enrich_batch(self, chunks: List[ProcessedChunk]) -> List[ProcessedChunk]:
-        """Enrich multiple chunks"""
-        return [self.enrich(chunk) for chunk in chunks]
+        return chunk
 
-    def _extract_peptides(self, text: str) -> Set[str]:
-        """Extract peptide names from text"""
-        found = set()
+    def enrich_batch(
+        self,
+        chunks: Iterable[ProcessedChunk],
+        pool: Optional[ProcessPoolExecutor] = None
+    ) -> List[ProcessedChunk]:
+        """
+        Enrich multiple chunks
 
-        for pattern, name in self._peptide_regex.items():
-            if pattern.search(text):
-                found.add(name)
+        Enrichment is CPU-bound and independent per chunk, so large batches
+        can be fanned out over a pool from start_enrich_pool(). Workers
+        enrich copies - use the returned list.
+        """
+        if pool is None:
+            return [self.enrich(chunk) for chunk in chunks]
 
-        return found
+        # Small batches aren't worth the pickling
+        chunks = list(chunks)
+        if len(chunks) < 2 * POOL_CHUNKSIZE:
+            return [self.enrich(chunk) for chunk in chunks]
 
-    def _extract_conditions(self, text: str) -> Set[str]:
-        """Extract medical conditions from text"""
-        found = set()
+        return list(pool.map(_enrich_in_worker, chunks, chunksize=POOL_CHUNKSIZE))
 
-        for pattern, condition in self._condition_regex.items():
-            if pattern.search(text):
-                found.add(condition)
+    def _extract_peptides(self, data: bytes) -> Set[str]:
+        """Extract peptide names from UTF-8 text"""
+        return self._peptide_matcher.find(data)
 
-        return found
+    def _extract_conditions(self, data: bytes) -> Set[str]:
+        """Extract medical conditions from UTF-8 text"""
+        return self._condition_matcher.find(data)
 
     def _get_fda_status(self, peptides: Set[str]) -> FDAStatus:
         """
@@ -210,23 +359,39 @@ class PeptideEnricher:
         if not peptides:
             return FDAStatus.UNKNOWN
 
-        statuses = [
-            self.FDA_STATUS.get(p, FDAStatus.UNKNOWN)
+        rank = min(
+            self._STATUS_RANK[self.FDA_STATUS.get(p, FDAStatus.UNKNOWN)]
             for p in peptides
-        ]
+        )
+        return self._RANK_STATUS[rank]
 
-        # Priority order (most restrictive first)
-        priority = [
-            FDAStatus.BANNED_COMPOUNDING,
-            FDAStatus.NOT_APPROVED,
-            FDAStatus.INVESTIGATIONAL,
-            FDAStatus.TRIAL,
-            FDAStatus.APPROVED,
-            FDAStatus.UNKNOWN,
-        ]
 
-        for status in priority:
-            if status in statuses:
-                return status
+# One fused scan per table instead of one search per pattern, built once
+_PEPTIDE_MATCHER = _FusedMatcher(PeptideEnricher.PEPTIDE_PATTERNS)
+_CONDITION_MATCHER = _FusedMatcher(PeptideEnricher.CONDITION_PATTERNS)
+
+
+def start_enrich_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Start a process pool for enrich_batch
+
+    Workers are started by a forkserver rather than forked from the
+    caller, so they inherit none of its threads or open gRPC channels.
+    Keep one pool for a whole run: each worker's enricher, and its digest
+    cache, lives as long as the pool.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("forkserver")
+    )
+
+
+# Per-process enricher for enrich_batch workers, built on first use
+_worker_enricher: Optional[PeptideEnricher] = None
+
 
-        return FDAStatus.UNKNOWN
+def _enrich_in_worker(chunk: ProcessedChunk) -> ProcessedChunk:
+    global _worker_enricher
+    if _worker_enricher is None:
+        _worker_enricher = PeptideEnricher()
+    return _worker_enricher.enrich(chunk)
@@ -10,12 +10,13 @@ Orchestrates the full document processing flow:
 
 import asyncio
 import logging
-from typing import Optional, AsyncGenerator, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, AsyncGenerator, List, Tuple
 from datetime import datetime
 
 from sources.pubmed import PubMedAdapter
 from processing.chunker import PeptideChunker, SimpleChunker
-from processing.enricher import PeptideEnricher
+from processing.enricher import PeptideEnricher, start_enrich_pool
 from storage.weaviate_client import WeaviateClient
 from models.documents import RawDocument, ProcessedChunk
 
@@ -37,11 +38,15 @@ class IngestionPipeline:
         self,
         weaviate_client: WeaviateClient,
         chunker: Optional[PeptideChunker] = None,
-        enricher: Optional[PeptideEnricher] = None
+        enricher: Optional[PeptideEnricher] = None,
+        enrich_workers: int = 1
     ):
         self.weaviate = weaviate_client
         self.chunker = chunker or SimpleChunker()
         self.enricher = enricher or PeptideEnricher()
+        self.enrich_workers = enrich_workers  # 1 = in-process, more = process pool
+        self._enrich_pool: Optional[ProcessPoolExecutor] = None  # Kept for one run
+        self._indexing: Optional[asyncio.Future] = None  # Previous batch, still indexing
 
         # Stats
         self.stats = {
@@ -57,7 +62,8 @@ class IngestionPipeline:
         self,
         queries: Optional[List[str]] = None,
         max_per_query: int = 100,
-        batch_size: int = 50
+        batch_size: int = 50,
+        concurrency: int = 4
     ) -> dict:
         """
         Ingest papers from PubMed
@@ -66,6 +72,8 @@ class IngestionPipeline:
             queries: List of search queries (uses defaults if None)
             max_per_query: Max papers per query
             batch_size: Documents per processing batch
+            concurrency: Queries fetched at once (batches are still
+                processed one at a time)
 
         Returns:
             Stats dictionary
@@ -79,22 +87,31 @@ class IngestionPipeline:
 
         logger.info(f"Starting PubMed ingestion with {len(queries)} queries")
 
-        for query in queries:
-            logger.info(f"Processing query: {query}")
+        query_slots = asyncio.Semaphore(concurrency)
+        batch_lock = asyncio.Lock()
+        self._start_enrich_pool()
 
-            try:
-                # Fetch documents
-                documents = await adapter.search(query, max_results=max_per_query)
-                logger.info(f"  Found {len(documents)} documents")
+        async def ingest_query(query: str):
+            async with query_slots:
+                logger.info(f"Processing query: {query}")
 
-                # Process in batches
-                for i in range(0, len(documents), batch_size):
-                    batch = documents[i:i + batch_size]
-                    await self._process_batch(batch)
+                try:
+                    # Fetch and process batch by batch, so only one batch of
+                    # documents per query is held at a time
+                    async for batch in adapter.stream(query, batch_size=batch_size, max_results=max_per_query):
+                        async with batch_lock:
+                            await self._process_batch(batch)
 
-            except Exception as e:
-                logger.error(f"Error processing query '{query}': {e}")
-                self.stats["errors"] += 1
+                except Exception as e:
+                    logger.error(f"Error processing query '{query}': {e}")
+                    self.stats["errors"] += 1
+
+        try:
+            await asyncio.gather(*(ingest_query(query) for query in queries))
+            await self._drain_indexing()
+        finally:
+            await adapter.close()
+            self._shutdown_enrich_pool()
 
         self.stats["end_time"] = datetime.utcnow()
         self._log_stats()
@@ -111,9 +128,15 @@ class IngestionPipeline:
         Use this for custom ingestion flows.
         """
         self.stats["start_time"] = datetime.utcnow()
+        self._start_enrich_pool()
 
-        async for batch in documents:
-            await self._process_batch(batch)
+        try:
+            async for batch in documents:
+                await self._process_batch(batch)
+
+            await self._drain_indexing()
+        finally:
+            self._shutdown_enrich_pool()
 
         self.stats["end_time"] = datetime.utcnow()
         self._log_stats()
@@ -121,34 +144,96 @@ class IngestionPipeline:
         return self.stats
 
     async def _process_batch(self, documents: List[RawDocument]):
-        """Process a batch of documents"""
-        all_chunks = []
+        """
+        Process a batch of documents
 
-        for doc in documents:
-            try:
-                # Chunk the document
-                chunks = self.chunker.chunk_document(doc)
+        Chunking and enrichment run on a worker thread while the previous
+        batch is still being indexed; await _drain_indexing() when done.
+        """
+        loop = asyncio.get_running_loop()
+        chunks, processed, errors = await loop.run_in_executor(None, self._prepare_chunks, documents)
+
+        self.stats["documents_processed"] += processed
+        self.stats["chunks_created"] += len(chunks)
+        self.stats["errors"] += errors
+
+        await self._drain_indexing()
+        if chunks:
+            self._indexing = asyncio.ensure_future(self._index_chunks(chunks))
+
+    async def _drain_indexing(self):
+        """Wait for the in-flight indexing of the previous batch, if any"""
+        if self._indexing is not None:
+            indexing, self._indexing = self._indexing, None
+            await indexing
+
+    def _start_enrich_pool(self):
+        """Start the enrichment pool for this run, if enrichment is parallel"""
+        if self.enrich_workers > 1 and self._enrich_pool is None:
+            self._enrich_pool = start_enrich_pool(self.enrich_workers)
+
+    def _shutdown_enrich_pool(self):
+        """Stop the enrichment pool once the run is over"""
+        if self._enrich_pool is not None:
+            pool, self._enrich_pool = self._enrich_pool, None
+            pool.shutdown()
+
+    def _prepare_chunks(self, documents: List[RawDocument]) -> Tuple[List[ProcessedChunk], int, int]:
+        """
+        Chunk and enrich documents (runs off the event loop)
 
-                # Enrich each chunk
-                enriched = self.enricher.enrich_batch(chunks)
+        A document that fails to chunk or enrich is logged, counted as an
+        error and left out; the rest of the batch carries on.
 
-                all_chunks.extend(enriched)
-                self.stats["documents_processed"] += 1
-                self.stats["chunks_created"] += len(chunks)
+        Returns (enriched chunks, documents processed, errors).
+        """
+        chunked = []
+        errors = 0
+
+        for doc in documents:
+            try:
+                chunked.append((doc, list(self.chunker.chunk_document(doc))))
 
             except Exception as e:
                 logger.error(f"Error processing document {doc.source_id}: {e}")
-                self.stats["errors"] += 1
+                errors += 1
+
+        # With a pool, enrich the whole batch at once so it can be spread
+        # across cores; if that fails, redo it per document to isolate the cause
+        if self._enrich_pool is not None:
+            try:
+                enriched = self.enricher.enrich_batch(
+                    [chunk for _, chunks in chunked for chunk in chunks],
+                    pool=self._enrich_pool
+                )
+                return enriched, len(chunked), errors
+            except Exception as e:
+                logger.warning(f"Pooled enrichment failed, retrying per document: {e}")
+
+        all_chunks = []
+        processed = 0
 
-        # Index chunks in Weaviate
-        if all_chunks:
+        for doc, chunks in chunked:
             try:
-                indexed = await self.weaviate.index_chunks_batch(all_chunks)
-                self.stats["chunks_indexed"] += indexed
-                logger.info(f"  Indexed {indexed} chunks")
+                all_chunks.extend(self.enricher.enrich_batch(chunks))
+                processed += 1
+
             except Exception as e:
-                logger.error(f"Error indexing chunks: {e}")
-                self.stats["errors"] += 1
+                logger.error(f"Error processing document {doc.source_id}: {e}")
+                errors += 1
+
+        return all_chunks, processed, errors
+
+    async def _index_chunks(self, chunks: List[ProcessedChunk]):
+        """Index chunks in Weaviate"""
+        try:
+            failed = await self.weaviate.index_chunks_batch(chunks)
+            indexed = len(chunks) - len(failed)
+            self.stats["chunks_indexed"] += indexed
+            logger.info(f"  Indexed {indexed} chunks")
+        except Exception as e:
+            logger.error(f"Error indexing chunks: {e}")
+            self.stats["errors"] += 1
 
     def _log_stats(self):
         """Log ingestion statistics"""
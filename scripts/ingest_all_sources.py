@@ -10,15 +10,17 @@ Usage:
     python scripts/ingest_all_sources.py --clinical      # Ingest ClinicalTrials only
     python scripts/ingest_all_sources.py --all           # Ingest all sources
     python scripts/ingest_all_sources.py --check         # Check current counts
+    python scripts/ingest_all_sources.py --all --seen-file .ingest_seen  # Skip content indexed by earlier runs
 """
 
 import asyncio
+import hashlib
 import os
 import sys
 import argparse
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Iterable
 from uuid import uuid4
 
 # Add parent directory to path
@@ -27,7 +29,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
-from storage.weaviate_client import WeaviateClient, CHUNKS_COLLECTION
+from storage.weaviate_client import WeaviateClient, CHUNKS_COLLECTION, INDEX_BATCH_SIZE
 from models.documents import ProcessedChunk, SourceType, FDAStatus
 from sources.reddit_ingestion import RedditIngestion
 from sources.clinicaltrials_ingestion import ClinicalTrialsIngestion
@@ -36,12 +38,83 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
-async def ingest_reddit(weaviate: WeaviateClient, posts_per_sub: int = 50) -> int:
+class SeenContent:
+    """
+    Digests of chunk content already indexed, optionally persisted
+
+    An exact set of 16-byte blake2b digests, so boilerplate, cross-posts
+    and trials re-fetched on reruns never reach the vectorizer. Content
+    offered since the last commit is pending, in offer order; it only
+    counts as seen once it has actually been indexed.
+    """
+
+    DIGEST_SIZE = 16
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._seen: Set[bytes] = set()
+        self._pending: Dict[bytes, None] = {}  # In offer order, matching pending chunks
+        self.skipped = 0
+
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            self._seen = {
+                data[i:i + self.DIGEST_SIZE] for i in range(0, len(data), self.DIGEST_SIZE)
+            }
+            logger.info(f"Loaded {len(self._seen)} seen content digests from {path}")
+
+    def is_new(self, content: str) -> bool:
+        """True the first time content is offered; marks it pending"""
+        digest = hashlib.blake2b(content.encode(), digest_size=self.DIGEST_SIZE).digest()
+        if digest in self._seen or digest in self._pending:
+            self.skipped += 1
+            return False
+        self._pending[digest] = None
+        return True
+
+    def commit(self, failed: Iterable[int] = ()):
+        """Mark the pending batch seen, except the positions that failed to index"""
+        failed = set(failed)
+        self._seen.update(
+            digest for position, digest in enumerate(self._pending) if position not in failed
+        )
+        self._pending.clear()
+
+    def discard(self):
+        """Drop the pending batch so it is offered again next run"""
+        self._pending.clear()
+
+    def save(self):
+        if self.path:
+            with open(self.path, "wb") as f:
+                f.write(b"".join(self._seen))
+
+
+async def ingest_reddit(
+    weaviate: WeaviateClient,
+    posts_per_sub: int = 50,
+    seen: Optional[SeenContent] = None
+) -> int:
     """Ingest Reddit data and index to Weaviate"""
     logger.info("Starting Reddit ingestion...")
 
     ingestion = RedditIngestion()
+    seen = seen or SeenContent()
     indexed = 0
+    pending = []
+
+    async def flush():
+        nonlocal indexed
+        try:
+            failed = await weaviate.index_chunks_batch(pending)
+            seen.commit(failed)
+            indexed += len(pending) - len(failed)
+            logger.info(f"  Indexed {indexed} Reddit documents...")
+        except Exception as e:
+            seen.discard()
+            logger.warning(f"Failed to index batch of {len(pending)} Reddit posts: {e}")
+        pending.clear()
 
     try:
         posts = await ingestion.ingest_all(posts_per_sub=posts_per_sub)
@@ -68,14 +141,17 @@ async def ingest_reddit(weaviate: WeaviateClient, posts_per_sub: int = 50) -> in
                     citation=doc['citation'],
                 )
 
-                await weaviate.index_chunk(chunk)
-                indexed += 1
-
-                if indexed % 20 == 0:
-                    logger.info(f"  Indexed {indexed} Reddit documents...")
+                if seen.is_new(chunk.content):
+                    pending.append(chunk)
 
             except Exception as e:
-                logger.warning(f"Failed to index Reddit post {post.id}: {e}")
+                logger.warning(f"Failed to convert Reddit post {post.id}: {e}")
+
+            if len(pending) >= INDEX_BATCH_SIZE:
+                await flush()
+
+        if pending:
+            await flush()
 
     finally:
         await ingestion.close()
@@ -84,12 +160,26 @@ async def ingest_reddit(weaviate: WeaviateClient, posts_per_sub: int = 50) -> in
     return indexed
 
 
-async def ingest_clinical_trials(weaviate: WeaviateClient) -> int:
+async def ingest_clinical_trials(weaviate: WeaviateClient, seen: Optional[SeenContent] = None) -> int:
     """Ingest ClinicalTrials.gov data and index to Weaviate"""
     logger.info("Starting ClinicalTrials.gov ingestion...")
 
     ingestion = ClinicalTrialsIngestion()
+    seen = seen or SeenContent()
     indexed = 0
+    pending = []
+
+    async def flush():
+        nonlocal indexed
+        try:
+            failed = await weaviate.index_chunks_batch(pending)
+            seen.commit(failed)
+            indexed += len(pending) - len(failed)
+            logger.info(f"  Indexed {indexed} clinical trials...")
+        except Exception as e:
+            seen.discard()
+            logger.warning(f"Failed to index batch of {len(pending)} clinical trials: {e}")
+        pending.clear()
 
     try:
         trials = await ingestion.ingest_all_peptides()
@@ -115,14 +205,17 @@ async def ingest_clinical_trials(weaviate: WeaviateClient) -> int:
                     citation=doc['citation'],
                 )
 
-                await weaviate.index_chunk(chunk)
-                indexed += 1
-
-                if indexed % 10 == 0:
-                    logger.info(f"  Indexed {indexed} clinical trials...")
+                if seen.is_new(chunk.content):
+                    pending.append(chunk)
 
             except Exception as e:
-                logger.warning(f"Failed to index trial {trial.nct_id}: {e}")
+                logger.warning(f"Failed to convert trial {trial.nct_id}: {e}")
+
+            if len(pending) >= INDEX_BATCH_SIZE:
+                await flush()
+
+        if pending:
+            await flush()
 
     finally:
         await ingestion.close()
@@ -152,6 +245,7 @@ async def main():
     parser.add_argument("--all", action="store_true", help="Ingest all sources")
     parser.add_argument("--check", action="store_true", help="Just check current counts")
     parser.add_argument("--posts", type=int, default=50, help="Posts per subreddit (default: 50)")
+    parser.add_argument("--seen-file", help="Persist digests of indexed content here and skip it on later runs")
     args = parser.parse_args()
 
     # Connect to Weaviate
@@ -178,16 +272,19 @@ async def main():
             return
 
         total_indexed = 0
+        seen = SeenContent(args.seen_file)
 
         # Ingest based on flags
         if args.reddit or args.all:
-            count = await ingest_reddit(weaviate, posts_per_sub=args.posts)
+            count = await ingest_reddit(weaviate, posts_per_sub=args.posts, seen=seen)
             total_indexed += count
 
         if args.clinical or args.all:
-            count = await ingest_clinical_trials(weaviate)
+            count = await ingest_clinical_trials(weaviate, seen=seen)
             total_indexed += count
 
+        seen.save()
+
         if not (args.reddit or args.clinical or args.all):
             print("\nNo sources specified. Use --reddit, --clinical, or --all")
             print("Run with --help for usage information.")
@@ -195,6 +292,7 @@ async def main():
 
         # Final status
         print(f"\nTotal documents indexed this run: {total_indexed}")
+        print(f"Duplicates skipped: {seen.skipped}")
         await check_weaviate_status(weaviate)
 
     except Exception as e:
@@ -30,136 +30,136 @@ import re
 
 PRODUCTS = [
     # PEPTIDES
-    {"name": "BPC-157", "type": "peptide", "is_peptide": True, "description": "Body Protection Compound - healing and anti-inflammatory peptide"},
-    {"name": "SS-31", "type": "peptide", "is_peptide": True, "description": "Elamipretide - mitochondrial support peptide"},
-    {"name": "Semax", "type": "peptide", "is_peptide": True, "description": "Nootropic peptide for cognitive enhancement"},
-    {"name": "Selank", "type": "peptide", "is_peptide": True, "description": "Anxiolytic peptide for stress and anxiety"},
-    {"name": "Thymosin Alpha-1", "type": "peptide", "is_peptide": True, "description": "Immune modulating peptide"},
-    {"name": "Dihexa", "type": "peptide", "is_peptide": True, "description": "Cognitive enhancement peptide"},
-    {"name": "NAD+ IM", "type": "peptide", "is_peptide": True, "description": "Intramuscular NAD+ for cellular energy"},
-    {"name": "GHK-Cu", "type": "peptide", "is_peptide": True, "description": "Copper peptide for skin and wound healing"},
-    {"name": "TB-500", "type": "peptide", "is_peptide": True, "description": "Thymosin Beta-4 fragment for healing"},
-    {"name": "LL-37", "type": "peptide", "is_peptide": True, "description": "Antimicrobial peptide for immune support"},
-    {"name": "KPV", "type": "peptide", "is_peptide": True, "description": "Anti-inflammatory peptide"},
-    {"name": "Larazotide", "type": "peptide", "is_peptide": True, "description": "Gut barrier support peptide"},
-    {"name": "Epithalon", "type": "peptide", "is_peptide": True, "description": "Telomerase activating peptide for longevity"},
-    {"name": "DSIP", "type": "peptide", "is_peptide": True, "description": "Delta sleep inducing peptide"},
-    {"name": "CJC-1295", "type": "peptide", "is_peptide": True, "description": "Growth hormone releasing hormone analog"},
-    {"name": "Ipamorelin", "type": "peptide", "is_peptide": True, "description": "Growth hormone secretagogue"},
-    {"name": "Tesamorelin", "type": "peptide", "is_peptide": True, "description": "GHRH analog for fat loss"},
-    {"name": "PT-141", "type": "peptide", "is_peptide": True, "description": "Melanocortin peptide for sexual function"},
-    {"name": "Kisspeptin", "type": "peptide", "is_peptide": True, "description": "Reproductive hormone regulating peptide"},
-    {"name": "MOTS-c", "type": "peptide", "is_peptide": True, "description": "Mitochondrial peptide for metabolic health"},
-    {"name": "Humanin", "type": "peptide", "is_peptide": True, "description": "Neuroprotective mitochondrial peptide"},
-    {"name": "Semaglutide", "type": "peptide", "is_peptide": True, "description": "GLP-1 agonist for metabolic health"},
-    {"name": "Tirzepatide", "type": "peptide", "is_peptide": True, "description": "Dual GIP/GLP-1 agonist"},
-    {"name": "AOD-9604", "type": "peptide", "is_peptide": True, "description": "Fat loss peptide fragment"},
-    {"name": "5-Amino 1MQ", "type": "peptide", "is_peptide": True, "description": "NNMT inhibitor for metabolism"},
-    {"name": "P21", "type": "peptide", "is_peptide": True, "description": "CNTF mimetic for neurogenesis"},
-    {"name": "NA-Selank", "type": "peptide", "is_peptide": True, "description": "N-Acetyl Selank for enhanced bioavailability"},
+    {"name": "BPC-157", "type": "peptide", "description": "Body Protection Compound - healing and anti-inflammatory peptide"},
+    {"name": "SS-31", "type": "peptide", "description": "Elamipretide - mitochondrial support peptide"},
+    {"name": "Semax", "type": "peptide", "description": "Nootropic peptide for cognitive enhancement"},
+    {"name": "Selank", "type": "peptide", "description": "Anxiolytic peptide for stress and anxiety"},
+    {"name": "Thymosin Alpha-1", "type": "peptide", "description": "Immune modulating peptide"},
+    {"name": "Dihexa", "type": "peptide", "description": "Cognitive enhancement peptide"},
+    {"name": "NAD+ IM", "type": "peptide", "description": "Intramuscular NAD+ for cellular energy"},
+    {"name": "GHK-Cu", "type": "peptide", "description": "Copper peptide for skin and wound healing"},
+    {"name": "TB-500", "type": "peptide", "description": "Thymosin Beta-4 fragment for healing"},
+    {"name": "LL-37", "type": "peptide", "description": "Antimicrobial peptide for immune support"},
+    {"name": "KPV", "type": "peptide", "description": "Anti-inflammatory peptide"},
+    {"name": "Larazotide", "type": "peptide", "description": "Gut barrier support peptide"},
+    {"name": "Epithalon", "type": "peptide", "description": "Telomerase activating peptide for longevity"},
+    {"name": "DSIP", "type": "peptide", "description": "Delta sleep inducing peptide"},
+    {"name": "CJC-1295", "type": "peptide", "description": "Growth hormone releasing hormone analog"},
+    {"name": "Ipamorelin", "type": "peptide", "description": "Growth hormone secretagogue"},
+    {"name": "Tesamorelin", "type": "peptide", "description": "GHRH analog for fat loss"},
+    {"name": "PT-141", "type": "peptide", "description": "Melanocortin peptide for sexual function"},
+    {"name": "Kisspeptin", "type": "peptide", "description": "Reproductive hormone regulating peptide"},
+    {"name": "MOTS-c", "type": "peptide", "description": "Mitochondrial peptide for metabolic health"},
+    {"name": "Humanin", "type": "peptide", "description": "Neuroprotective mitochondrial peptide"},
+    {"name": "Semaglutide", "type": "peptide", "description": "GLP-1 agonist for metabolic health"},
+    {"name": "Tirzepatide", "type": "peptide", "description": "Dual GIP/GLP-1 agonist"},
+    {"name": "AOD-9604", "type": "peptide", "description": "Fat loss peptide fragment"},
+    {"name": "5-Amino 1MQ", "type": "peptide", "description": "NNMT inhibitor for metabolism"},
+    {"name": "P21", "type": "peptide", "description": "CNTF mimetic for neurogenesis"},
+    {"name": "NA-Selank", "type": "peptide", "description": "N-Acetyl Selank for enhanced bioavailability"},
 
     # ADAPTOGENS
-    {"name": "Ashwagandha", "type": "adaptogen", "is_peptide": False, "description": "Adaptogen for stress, cortisol, and energy"},
-    {"name": "Rhodiola", "type": "adaptogen", "is_peptide": False, "description": "Adaptogen for energy and mental performance"},
-    {"name": "Cordyceps", "type": "adaptogen", "is_peptide": False, "description": "Mushroom for energy and endurance"},
-    {"name": "Lion's Mane", "type": "adaptogen", "is_peptide": False, "description": "Mushroom for cognitive function and nerve health"},
-    {"name": "Reishi", "type": "adaptogen", "is_peptide": False, "description": "Mushroom for immune support and sleep"},
-    {"name": "Holy Basil", "type": "adaptogen", "is_peptide": False, "description": "Adaptogen for stress and inflammation"},
-    {"name": "Maca", "type": "adaptogen", "is_peptide": False, "description": "Root for energy and hormonal balance"},
-    {"name": "Schisandra", "type": "adaptogen", "is_peptide": False, "description": "Adaptogen for liver and stress support"},
-    {"name": "Licorice Root", "type": "adaptogen", "is_peptide": False, "description": "Adrenal support herb"},
-    {"name": "Adrenal Cortex", "type": "supplement", "is_peptide": False, "description": "Glandular support for adrenals"},
+    {"name": "Ashwagandha", "type": "adaptogen", "description": "Adaptogen for stress, cortisol, and energy"},
+    {"name": "Rhodiola", "type": "adaptogen", "description": "Adaptogen for energy and mental performance"},
+    {"name": "Cordyceps", "type": "adaptogen", "description": "Mushroom for energy and endurance"},
+    {"name": "Lion's Mane", "type": "adaptogen", "description": "Mushroom for cognitive function and nerve health"},
+    {"name": "Reishi", "type": "adaptogen", "description": "Mushroom for immune support and sleep"},
+    {"name": "Holy Basil", "type": "adaptogen", "description": "Adaptogen for stress and inflammation"},
+    {"name": "Maca", "type": "adaptogen", "description": "Root for energy and hormonal balance"},
+    {"name": "Schisandra", "type": "adaptogen", "description": "Adaptogen for liver and stress support"},
+    {"name": "Licorice Root", "type": "adaptogen", "description": "Adrenal support herb"},
+    {"name": "Adrenal Cortex", "type": "supplement", "description": "Glandular support for adrenals"},
 
     # AMINO ACIDS
-    {"name": "L-Theanine", "type": "amino_acid", "is_peptide": False, "description": "Calming amino acid from tea"},
-    {"name": "L-Tyrosine", "type": "amino_acid", "is_peptide": False, "description": "Dopamine precursor"},
-    {"name": "L-Glutamine", "type": "amino_acid", "is_peptide": False, "description": "Gut healing and immune support"},
-    {"name": "L-Tryptophan", "type": "amino_acid", "is_peptide": False, "description": "Serotonin precursor"},
-    {"name": "Glycine", "type": "amino_acid", "is_peptide": False, "description": "Calming amino acid for sleep"},
-    {"name": "Taurine", "type": "amino_acid", "is_peptide": False, "description": "Amino acid for heart and brain"},
-    {"name": "NAC", "type": "amino_acid", "is_peptide": False, "description": "N-Acetyl Cysteine - glutathione precursor"},
-    {"name": "Acetyl L-Carnitine", "type": "amino_acid", "is_peptide": False, "description": "Mitochondrial support amino acid"},
-    {"name": "GABA", "type": "amino_acid", "is_peptide": False, "description": "Calming neurotransmitter"},
-    {"name": "Phenylalanine", "type": "amino_acid", "is_peptide": False, "description": "Dopamine and norepinephrine precursor"},
-    {"name": "Agmatine", "type": "amino_acid", "is_peptide": False, "description": "Neuromodulator for mood and pain"},
-    {"name": "5-HTP", "type": "amino_acid", "is_peptide": False, "description": "Direct serotonin precursor"},
+    {"name": "L-Theanine", "type": "amino_acid", "description": "Calming amino acid from tea"},
+    {"name": "L-Tyrosine", "type": "amino_acid", "description": "Dopamine precursor"},
+    {"name": "L-Glutamine", "type": "amino_acid", "description": "Gut healing and immune support"},
+    {"name": "L-Tryptophan", "type": "amino_acid", "description": "Serotonin precursor"},
+    {"name": "Glycine", "type": "amino_acid", "description": "Calming amino acid for sleep"},
+    {"name": "Taurine", "type": "amino_acid", "description": "Amino acid for heart and brain"},
+    {"name": "NAC", "type": "amino_acid", "description": "N-Acetyl Cysteine - glutathione precursor"},
+    {"name": "Acetyl L-Carnitine", "type": "amino_acid", "description": "Mitochondrial support amino acid"},
+    {"name": "GABA", "type": "amino_acid", "description": "Calming neurotransmitter"},
+    {"name": "Phenylalanine", "type": "amino_acid", "description": "Dopamine and norepinephrine precursor"},
+    {"name": "Agmatine", "type": "amino_acid", "description": "Neuromodulator for mood and pain"},
+    {"name": "5-HTP", "type": "amino_acid", "description": "Direct serotonin precursor"},
 
     # VITAMINS
-    {"name": "Vitamin D3", "type": "vitamin", "is_peptide": False, "description": "Essential hormone vitamin"},
-    {"name": "Vitamin B12", "type": "vitamin", "is_peptide": False, "description": "Energy and nerve vitamin"},
-    {"name": "Vitamin B Complex", "type": "vitamin", "is_peptide": False, "description": "Full spectrum B vitamins"},
-    {"name": "Methylated B Complex", "type": "vitamin", "is_peptide": False, "description": "Active form B vitamins"},
-    {"name": "Vitamin C", "type": "vitamin", "is_peptide": False, "description": "Antioxidant and immune support"},
-    {"name": "Vitamin E", "type": "vitamin", "is_peptide": False, "description": "Fat-soluble antioxidant"},
-    {"name": "Vitamin A", "type": "vitamin", "is_peptide": False, "description": "Vision and immune vitamin"},
-    {"name": "Vitamin K2", "type": "vitamin", "is_peptide": False, "description": "Calcium metabolism vitamin"},
-    {"name": "Riboflavin", "type": "vitamin", "is_peptide": False, "description": "Vitamin B2 for energy and migraines"},
-    {"name": "Benfotiamine", "type": "vitamin", "is_peptide": False, "description": "Fat-soluble vitamin B1"},
+    {"name": "Vitamin D3", "type": "vitamin", "description": "Essential hormone vitamin"},
+    {"name": "Vitamin B12", "type": "vitamin", "description": "Energy and nerve vitamin"},
+    {"name": "Vitamin B Complex", "type": "vitamin", "description": "Full spectrum B vitamins"},
+    {"name": "Methylated B Complex", "type": "vitamin", "description": "Active form B vitamins"},
+    {"name": "Vitamin C", "type": "vitamin", "description": "Antioxidant and immune support"},
+    {"name": "Vitamin E", "type": "vitamin", "description": "Fat-soluble antioxidant"},
+    {"name": "Vitamin A", "type": "vitamin", "description": "Vision and immune vitamin"},
+    {"name": "Vitamin K2", "type": "vitamin", "description": "Calcium metabolism vitamin"},
+    {"name": "Riboflavin", "type": "vitamin", "description": "Vitamin B2 for energy and migraines"},
+    {"name": "Benfotiamine", "type": "vitamin", "description": "Fat-soluble vitamin B1"},
 
     # MINERALS
-    {"name": "Magnesium Glycinate", "type": "mineral", "is_peptide": False, "description": "Highly absorbable calming magnesium"},
-    {"name": "Magnesium Threonate", "type": "mineral", "is_peptide": False, "description": "Brain-penetrating magnesium"},
-    {"name": "Zinc", "type": "mineral", "is_peptide": False, "description": "Immune and hormone mineral"},
-    {"name": "Selenium", "type": "mineral", "is_peptide": False, "description": "Thyroid and antioxidant mineral"},
-    {"name": "Iron Bisglycinate", "type": "mineral", "is_peptide": False, "description": "Gentle absorbable iron"},
-    {"name": "Potassium Citrate", "type": "mineral", "is_peptide": False, "description": "Electrolyte mineral"},
-    {"name": "Iodine", "type": "mineral", "is_peptide": False, "description": "Thyroid essential mineral"},
-    {"name": "Chromium", "type": "mineral", "is_peptide": False, "description": "Blood sugar support mineral"},
-    {"name": "Boron", "type": "mineral", "is_peptide": False, "description": "Bone and hormone mineral"},
-    {"name": "Electrolytes", "type": "mineral", "is_peptide": False, "description": "Balanced mineral blend"},
+    {"name": "Magnesium Glycinate", "type": "mineral", "description": "Highly absorbable calming magnesium"},
+    {"name": "Magnesium Threonate", "type": "mineral", "description": "Brain-penetrating magnesium"},
+    {"name": "Zinc", "type": "mineral", "description": "Immune and hormone mineral"},
+    {"name": "Selenium", "type": "mineral", "description": "Thyroid and antioxidant mineral"},
+    {"name": "Iron Bisglycinate", "type": "mineral", "description": "Gentle absorbable iron"},
+    {"name": "Potassium Citrate", "type": "mineral", "description": "Electrolyte mineral"},
+    {"name": "Iodine", "type": "mineral", "description": "Thyroid essential mineral"},
+    {"name": "Chromium", "type": "mineral", "description": "Blood sugar support mineral"},
+    {"name": "Boron", "type": "mineral", "description": "Bone and hormone mineral"},
+    {"name": "Electrolytes", "type": "mineral", "description": "Balanced mineral blend"},
 
     # SUPPLEMENTS
-    {"name": "CoQ10", "type": "supplement", "is_peptide": False, "description": "Mitochondrial coenzyme"},
-    {"name": "Alpha Lipoic Acid", "type": "supplement", "is_peptide": False, "description": "Universal antioxidant"},
-    {"name": "Omega-3s", "type": "supplement", "is_peptide": False, "description": "Fish oil for brain and inflammation"},
-    {"name": "Curcumin", "type": "supplement", "is_peptide": False, "description": "Turmeric extract anti-inflammatory"},
-    {"name": "Quercetin", "type": "supplement", "is_peptide": False, "description": "Flavonoid for inflammation and allergies"},
-    {"name": "Resveratrol", "type": "supplement", "is_peptide": False, "description": "Longevity polyphenol"},
-    {"name": "PQQ", "type": "supplement", "is_peptide": False, "description": "Mitochondrial biogenesis support"},
-    {"name": "Glutathione", "type": "supplement", "is_peptide": False, "description": "Master antioxidant"},
-    {"name": "Alpha GPC", "type": "supplement", "is_peptide": False, "description": "Choline source for brain"},
-    {"name": "Phosphatidylcholine", "type": "supplement", "is_peptide": False, "description": "Cell membrane support"},
-    {"name": "Phosphatidylserine", "type": "supplement", "is_peptide": False, "description": "Brain cell membrane support"},
-    {"name": "Inositol", "type": "supplement", "is_peptide": False, "description": "Mood and hormone support"},
-    {"name": "SAMe", "type": "supplement", "is_peptide": False, "description": "Methylation and mood support"},
-    {"name": "DIM", "type": "supplement", "is_peptide": False, "description": "Estrogen metabolism support"},
-    {"name": "I3C", "type": "supplement", "is_peptide": False, "description": "Indole-3-Carbinol for estrogen balance"},
-    {"name": "Berberine", "type": "supplement", "is_peptide": False, "description": "Blood sugar and gut support"},
-    {"name": "Milk Thistle", "type": "supplement", "is_peptide": False, "description": "Liver support herb"},
-    {"name": "TUDCA", "type": "supplement", "is_peptide": False, "description": "Bile acid for liver support"},
-    {"name": "Digestive Enzymes", "type": "supplement", "is_peptide": False, "description": "Enzyme blend for digestion"},
-    {"name": "Betaine HCL", "type": "supplement", "is_peptide": False, "description": "Stomach acid support"},
-    {"name": "Beet Root", "type": "supplement", "is_peptide": False, "description": "Nitric oxide support"},
-    {"name": "Huperzine A", "type": "supplement", "is_peptide": False, "description": "Acetylcholine support"},
-    {"name": "Uridine Monophosphate", "type": "supplement", "is_peptide": False, "description": "Brain health nucleotide"},
-    {"name": "Caffeine", "type": "supplement", "is_peptide": False, "description": "Stimulant for focus"},
-    {"name": "Cinnamon Extract", "type": "supplement", "is_peptide": False, "description": "Blood sugar support"},
-    {"name": "Ginger Extract", "type": "supplement", "is_peptide": False, "description": "Digestive and anti-nausea"},
-    {"name": "Melatonin", "type": "supplement", "is_peptide": False, "description": "Sleep hormone"},
-    {"name": "DHEA", "type": "hormone", "is_peptide": False, "description": "Precursor hormone"},
-    {"name": "Pregnenolone", "type": "hormone", "is_peptide": False, "description": "Master hormone precursor"},
+    {"name": "CoQ10", "type": "supplement", "description": "Mitochondrial coenzyme"},
+    {"name": "Alpha Lipoic Acid", "type": "supplement", "description": "Universal antioxidant"},
+    {"name": "Omega-3s", "type": "supplement", "description": "Fish oil for brain and inflammation"},
+    {"name": "Curcumin", "type": "supplement", "description": "Turmeric extract anti-inflammatory"},
+    {"name": "Quercetin", "type": "supplement", "description": "Flavonoid for inflammation and allergies"},
+    {"name": "Resveratrol", "type": "supplement", "description": "Longevity polyphenol"},
+    {"name": "PQQ", "type": "supplement", "description": "Mitochondrial biogenesis support"},
+    {"name": "Glutathione", "type": "supplement", "description": "Master antioxidant"},
+    {"name": "Alpha GPC", "type": "supplement", "description": "Choline source for brain"},
+    {"name": "Phosphatidylcholine", "type": "supplement", "description": "Cell membrane support"},
+    {"name": "Phosphatidylserine", "type": "supplement", "description": "Brain cell membrane support"},
+    {"name": "Inositol", "type": "supplement", "description": "Mood and hormone support"},
+    {"name": "SAMe", "type": "supplement", "description": "Methylation and mood support"},
+    {"name": "DIM", "type": "supplement", "description": "Estrogen metabolism support"},
+    {"name": "I3C", "type": "supplement", "description": "Indole-3-Carbinol for estrogen balance"},
+    {"name": "Berberine", "type": "supplement", "description": "Blood sugar and gut support"},
+    {"name": "Milk Thistle", "type": "supplement", "description": "Liver support herb"},
+    {"name": "TUDCA", "type": "supplement", "description": "Bile acid for liver support"},
+    {"name": "Digestive Enzymes", "type": "supplement", "description": "Enzyme blend for digestion"},
+    {"name": "Betaine HCL", "type": "supplement", "description": "Stomach acid support"},
+    {"name": "Beet Root", "type": "supplement", "description": "Nitric oxide support"},
+    {"name": "Huperzine A", "type": "supplement", "description": "Acetylcholine support"},
+    {"name": "Uridine Monophosphate", "type": "supplement", "description": "Brain health nucleotide"},
+    {"name": "Caffeine", "type": "supplement", "description": "Stimulant for focus"},
+    {"name": "Cinnamon Extract", "type": "supplement", "description": "Blood sugar support"},
+    {"name": "Ginger Extract", "type": "supplement", "description": "Digestive and anti-nausea"},
+    {"name": "Melatonin", "type": "supplement", "description": "Sleep hormone"},
+    {"name": "DHEA", "type": "hormone", "description": "Precursor hormone"},
+    {"name": "Pregnenolone", "type": "hormone", "description": "Master hormone precursor"},
 
     # PROBIOTICS
-    {"name": "Probiotics", "type": "probiotic", "is_peptide": False, "description": "Beneficial gut bacteria"},
-    {"name": "Spore Probiotics", "type": "probiotic", "is_peptide": False, "description": "Shelf-stable spore-forming probiotics"},
-    {"name": "Saccharomyces Boulardii", "type": "probiotic", "is_peptide": False, "description": "Beneficial yeast probiotic"},
+    {"name": "Probiotics", "type": "probiotic", "description": "Beneficial gut bacteria"},
+    {"name": "Spore Probiotics", "type": "probiotic", "description": "Shelf-stable spore-forming probiotics"},
+    {"name": "Saccharomyces Boulardii", "type": "probiotic", "description": "Beneficial yeast probiotic"},
 
     # HERBS
-    {"name": "Vitex", "type": "herb", "is_peptide": False, "description": "Chasteberry for hormone balance"},
-    {"name": "Black Cohosh", "type": "herb", "is_peptide": False, "description": "Menopause support herb"},
-    {"name": "Red Clover", "type": "herb", "is_peptide": False, "description": "Phytoestrogen herb"},
-    {"name": "Dong Quai", "type": "herb", "is_peptide": False, "description": "Female hormone support"},
-    {"name": "Evening Primrose Oil", "type": "herb", "is_peptide": False, "description": "GLA source for hormones"},
-    {"name": "Dandelion", "type": "herb", "is_peptide": False, "description": "Liver and diuretic herb"},
-    {"name": "Bitters", "type": "herb", "is_peptide": False, "description": "Digestive bitters blend"},
-    {"name": "Oregano Oil", "type": "herb", "is_peptide": False, "description": "Antimicrobial herb"},
-    {"name": "Caprylic Acid", "type": "herb", "is_peptide": False, "description": "Antifungal from coconut"},
-    {"name": "D-Mannose", "type": "supplement", "is_peptide": False, "description": "Urinary tract support"},
-    {"name": "Cranberry Extract", "type": "herb", "is_peptide": False, "description": "Urinary tract support"},
-    {"name": "Saw Palmetto", "type": "herb", "is_peptide": False, "description": "Prostate and hormone support"},
-    {"name": "Stinging Nettle", "type": "herb", "is_peptide": False, "description": "Histamine and prostate support"},
-    {"name": "DAO Enzyme", "type": "enzyme", "is_peptide": False, "description": "Diamine oxidase for histamine"},
-    {"name": "Lymphatic Herbs", "type": "herb", "is_peptide": False, "description": "Blend for lymphatic drainage"},
+    {"name": "Vitex", "type": "herb", "description": "Chasteberry for hormone balance"},
+    {"name": "Black Cohosh", "type": "herb", "description": "Menopause support herb"},
+    {"name": "Red Clover", "type": "herb", "description": "Phytoestrogen herb"},
+    {"name": "Dong Quai", "type": "herb", "description": "Female hormone support"},
+    {"name": "Evening Primrose Oil", "type": "herb", "description": "GLA source for hormones"},
+    {"name": "Dandelion", "type": "herb", "description": "Liver and diuretic herb"},
+    {"name": "Bitters", "type": "herb", "description": "Digestive bitters blend"},
+    {"name": "Oregano Oil", "type": "herb", "description": "Antimicrobial herb"},
+    {"name": "Caprylic Acid", "type": "herb", "description": "Antifungal from coconut"},
+    {"name": "D-Mannose", "type": "supplement", "description": "Urinary tract support"},
+    {"name": "Cranberry Extract", "type": "herb", "description": "Urinary tract support"},
+    {"name": "Saw Palmetto", "type": "herb", "description": "Prostate and hormone support"},
+    {"name": "Stinging Nettle", "type": "herb", "description": "Histamine and prostate support"},
+    {"name": "DAO Enzyme", "type": "enzyme", "description": "Diamine oxidase for histamine"},
+    {"name": "Lymphatic Herbs", "type": "herb", "description": "Blend for lymphatic drainage"},
 ]
 
 
@@ -236,6 +236,23 @@ LAB_TESTS = [
 ]
 
 
+# =============================================================================
+# NAME ALIASES
+# =============================================================================
+
+# Names used in SYMPTOM_MAPPINGS for an entry listed above under another name
+PRODUCT_ALIASES = {
+    "B12": "Vitamin B12",
+    "Glutamine": "L-Glutamine",
+}
+
+LAB_ALIASES = {
+    "Cortisol Curve": "Cortisol Rhythm",
+    "Cortisol Pattern": "Cortisol Rhythm",
+    "Neurotransmitter Metabolites": "Neurotransmitter Panel",
+}
+
+
 # =============================================================================
 # SYMPTOM-PRODUCT-LAB MAPPINGS
 # =============================================================================
@@ -1082,17 +1099,19 @@ SYMPTOM_MAPPINGS = [
 async def seed_products(db):
     """Seed all products"""
     print("Seeding products...")
+    existing = set(await db.products.distinct("name"))
     count = 0
     for p in PRODUCTS:
-        existing = await db.products.find_one({"name": p["name"]})
-        if not existing:
+        if p["name"] not in existing:
+            product_type = ProductType(p["type"])
             product = HolisticProduct(
                 name=p["name"],
-                product_type=ProductType(p["type"]),
-                is_peptide=p.get("is_peptide", False),
+                product_type=product_type,
+                is_peptide=product_type is ProductType.PEPTIDE,
                 description=p.get("description")
             )
             await db.products.insert_one(product.model_dump())
+            existing.add(p["name"])
             count += 1
     print(f"  Created {count} new products")
 
@@ -1100,57 +1119,76 @@ async def seed_products(db):
 async def seed_labs(db):
     """Seed all lab tests"""
     print("Seeding lab tests...")
+    existing = set(await db.lab_tests.distinct("name"))
     count = 0
     for lab in LAB_TESTS:
-        existing = await db.lab_tests.find_one({"name": lab["name"]})
-        if not existing:
+        if lab["name"] not in existing:
             lab_test = LabTest(
                 name=lab["name"],
                 description=lab.get("description")
             )
             await db.lab_tests.insert_one(lab_test.model_dump())
+            existing.add(lab["name"])
             count += 1
     print(f"  Created {count} new lab tests")
 
 
+async def _ids_by_name(collection, id_field: str) -> dict:
+    """Casefolded name -> id for every document in a collection, in one query"""
+    return {
+        doc["name"].casefold(): doc[id_field]
+        async for doc in collection.find({}, {"name": 1, id_field: 1})
+    }
+
+
+def _resolve_ids(names: list, ids_by_name: dict, aliases: dict, unresolved: set) -> list:
+    """IDs for names (case-insensitive, through aliases), without duplicates"""
+    ids = {}
+    for name in names:
+        key = aliases.get(name, name).casefold()
+        if key in ids_by_name:
+            ids[ids_by_name[key]] = None
+        else:
+            unresolved.add(name)
+    return list(ids)
+
+
 async def seed_symptoms(db):
     """Seed all symptoms with product and lab mappings"""
     print("Seeding symptoms...")
+    existing = set(await db.symptoms.distinct("slug"))
+    product_ids_by_name = await _ids_by_name(db.products, "product_id")
+    lab_ids_by_name = await _ids_by_name(db.lab_tests, "test_id")
+    unresolved_products, unresolved_labs = set(), set()
     count = 0
     for s in SYMPTOM_MAPPINGS:
         slug = re.sub(r'[^a-z0-9]+', '-', s["name"].lower()).strip('-')
 
-        existing = await db.symptoms.find_one({"slug": slug})
-        if existing:
+        if slug in existing:
             continue
 
-        # Get product IDs
-        product_ids = []
-        for product_name in s.get("products", []):
-            product = await db.products.find_one({"name": product_name})
-            if product:
-                product_ids.append(product["product_id"])
-
-        # Get lab IDs
-        lab_ids = []
-        for lab_name in s.get("labs", []):
-            lab = await db.lab_tests.find_one({"name": lab_name})
-            if lab:
-                lab_ids.append(lab["test_id"])
-
         symptom = Symptom(
             name=s["name"],
             slug=slug,
             category=SymptomCategory(s["category"]),
-            recommended_products=product_ids,
-            recommended_labs=lab_ids,
+            recommended_products=_resolve_ids(
+                s.get("products", []), product_ids_by_name, PRODUCT_ALIASES, unresolved_products
+            ),
+            recommended_labs=_resolve_ids(
+                s.get("labs", []), lab_ids_by_name, LAB_ALIASES, unresolved_labs
+            ),
             keywords=s.get("keywords", [])
         )
 
         await db.symptoms.insert_one(symptom.model_dump())
+        existing.add(slug)
         count += 1
 
     print(f"  Created {count} new symptoms")
+    if unresolved_products:
+        print(f"  Skipped unknown products: {', '.join(sorted(unresolved_products))}")
+    if unresolved_labs:
+        print(f"  Skipped unknown labs: {', '.join(sorted(unresolved_labs))}")
 
 
 async def main():
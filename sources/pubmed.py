@@ -68,17 +68,26 @@ class PubMedAdapter(BaseAdapter):
         # Rate limit: 3/sec without key, 10/sec with key
         self.rate_limit = 10 if self.api_key else 3
         self._last_request = 0
+        self._rate_lock = asyncio.Lock()  # Concurrent queries share the budget
+
+        # One pooled client for every request this adapter makes
+        self.client = httpx.AsyncClient(timeout=self.timeout)
 
     async def _rate_limit_wait(self):
         """Ensure we don't exceed rate limits"""
-        now = asyncio.get_event_loop().time()
-        min_interval = 1.0 / self.rate_limit
-        elapsed = now - self._last_request
+        async with self._rate_lock:
+            now = asyncio.get_event_loop().time()
+            min_interval = 1.0 / self.rate_limit
+            elapsed = now - self._last_request
+
+            if elapsed < min_interval:
+                await asyncio.sleep(min_interval - elapsed)
 
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
+            self._last_request = asyncio.get_event_loop().time()
 
-        self._last_request = asyncio.get_event_loop().time()
+    async def close(self):
+        """Close the HTTP client"""
+        await self.client.aclose()
 
     def _build_params(self, extra_params: dict) -> dict:
         """Build request parameters with auth"""
@@ -142,21 +151,20 @@ class PubMedAdapter(BaseAdapter):
             "sort": "relevance",
         })
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(ESEARCH_URL, params=params)
-                response.raise_for_status()
-                data = response.json()
+        try:
+            response = await self.client.get(ESEARCH_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
 
-                result = data.get("esearchresult", {})
-                pmids = result.get("idlist", [])
+            result = data.get("esearchresult", {})
+            pmids = result.get("idlist", [])
 
-                logger.info(f"Found {len(pmids)} papers for query: {query[:50]}...")
-                return pmids
+            logger.info(f"Found {len(pmids)} papers for query: {query[:50]}...")
+            return pmids
 
-            except Exception as e:
-                logger.error(f"PubMed search failed: {e}")
-                return []
+        except Exception as e:
+            logger.error(f"PubMed search failed: {e}")
+            return []
 
     async def _fetch_records(self, pmids: List[str]) -> List[RawDocument]:
         """Fetch full records for a list of PMIDs"""
@@ -178,18 +186,17 @@ class PubMedAdapter(BaseAdapter):
                 "retmode": "xml",
             })
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                try:
-                    response = await client.get(EFETCH_URL, params=params)
-                    response.raise_for_status()
+            try:
+                response = await self.client.get(EFETCH_URL, params=params)
+                response.raise_for_status()
 
-                    # Parse XML
-                    docs = self._parse_pubmed_xml(response.text)
-                    documents.extend(docs)
+                # Parse XML
+                docs = self._parse_pubmed_xml(response.text)
+                documents.extend(docs)
 
-                except Exception as e:
-                    logger.error(f"PubMed fetch failed for batch: {e}")
-                    continue
+            except Exception as e:
+                logger.error(f"PubMed fetch failed for batch: {e}")
+                continue
 
         return documents
 
@@ -397,17 +404,19 @@ class PubMedAdapter(BaseAdapter):
         self,
         query: str,
         batch_size: int = 100,
-        start_date: Optional[datetime] = None
+        start_date: Optional[datetime] = None,
+        max_results: int = 10000
     ) -> AsyncGenerator[List[RawDocument], None]:
         """
         Stream papers for bulk ingestion
 
-        Yields batches of papers for processing.
+        Yields batches of papers for processing; each batch is fetched
+        only when the previous one has been consumed.
         """
         # Get all PMIDs first
         pmids = await self._search_pmids(
             query + (f" AND ({start_date.strftime('%Y/%m/%d')}:3000/01/01[dp])" if start_date else ""),
-            max_results=10000
+            max_results=max_results
         )
 
         logger.info(f"Streaming {len(pmids)} papers for query: {query}")
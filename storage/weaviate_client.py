@@ -5,12 +5,13 @@ Handles all vector storage and retrieval operations.
 Supports hybrid search (BM25 + vector) with RRF fusion.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import weaviate
 from weaviate.classes.query import Filter, MetadataQuery, HybridFusion
-from weaviate.classes.config import Property, DataType, Configure, VectorDistances
+from weaviate.classes.config import Property, DataType, Configure, VectorDistances, Vectorizers
 from weaviate.classes.data import DataObject
 
 from models.documents import ProcessedChunk, SourceType, FDAStatus
@@ -22,6 +23,17 @@ logger = logging.getLogger(__name__)
 CHUNKS_COLLECTION = "PeptideChunk"
 OUTCOMES_COLLECTION = "JourneyOutcome"
 
+# OpenAI model used by the text2vec-openai vectorizer for new collections.
+# Query vectors passed to hybrid_search must come from the model the
+# existing collections were built with (see query_vector_model).
+VECTORIZER_MODEL = "text-embedding-3-small"
+
+# Query vector model per Weaviate URL, read from the live schema once per process
+_query_vector_models: Dict[str, Optional[str]] = {}
+
+# Objects per insert_many request when bulk indexing chunks
+INDEX_BATCH_SIZE = 1000
+
 
 class WeaviateClient:
     """
@@ -52,6 +64,8 @@ class WeaviateClient:
         self.api_key = api_key
         self.openai_api_key = openai_api_key
         self._client = None
+        # Embedding model all searched collections vectorize with, if any
+        self.query_vector_model: Optional[str] = None
 
     async def connect(self):
         """Connect to Weaviate instance"""
@@ -76,6 +90,10 @@ class WeaviateClient:
 
             logger.info(f"Connected to Weaviate at {self.url}")
 
+            if self.url not in _query_vector_models:
+                _query_vector_models[self.url] = self._read_query_vector_model()
+            self.query_vector_model = _query_vector_models[self.url]
+
         except Exception as e:
             logger.error(f"Failed to connect to Weaviate: {e}")
             raise
@@ -100,8 +118,37 @@ class WeaviateClient:
         """Create Weaviate collections for peptide data"""
         await self._create_chunks_collection()
         await self._create_outcomes_collection()
+        _query_vector_models[self.url] = self.query_vector_model = self._read_query_vector_model()
         logger.info("Weaviate schema created successfully")
 
+    def _read_query_vector_model(self) -> Optional[str]:
+        """
+        Read which embedding model hybrid_search query vectors must come from
+
+        Collections keep the vectorizer they were created with, whatever
+        VECTORIZER_MODEL says now. Returns None unless every existing
+        searched collection uses text2vec-openai with the same model at
+        its default dimensions; Weaviate then vectorizes queries itself.
+        """
+        models = set()
+        try:
+            for name in (CHUNKS_COLLECTION, OUTCOMES_COLLECTION):
+                if not self.client.collections.exists(name):
+                    continue
+                vectorizer = self.client.collections.get(name).config.get().vectorizer_config
+                if (
+                    vectorizer is None
+                    or vectorizer.vectorizer != Vectorizers.TEXT2VEC_OPENAI
+                    or vectorizer.model.get("dimensions")
+                ):
+                    return None
+                models.add(vectorizer.model.get("model"))
+        except Exception as e:
+            logger.warning(f"Could not read vectorizer config, query vectors disabled: {e}")
+            return None
+
+        return models.pop() if len(models) == 1 else None
+
     async def _create_chunks_collection(self):
         """Create collection for processed document chunks"""
         if self.client.collections.exists(CHUNKS_COLLECTION):
@@ -113,7 +160,7 @@ class WeaviateClient:
             description="Processed document chunks from research papers and other sources",
 
             # Enable hybrid search with OpenAI embeddings (for Weaviate Cloud)
-            vectorizer_config=Configure.Vectorizer.text2vec_openai(),
+            vectorizer_config=Configure.Vectorizer.text2vec_openai(model=VECTORIZER_MODEL),
 
             # Vector index config
             vector_index_config=Configure.VectorIndex.hnsw(
@@ -234,7 +281,7 @@ class WeaviateClient:
             name=OUTCOMES_COLLECTION,
             description="Aggregated user journey outcomes for RAG",
 
-            vectorizer_config=Configure.Vectorizer.text2vec_openai(),
+            vectorizer_config=Configure.Vectorizer.text2vec_openai(model=VECTORIZER_MODEL),
 
             properties=[
                 Property(
@@ -320,11 +367,10 @@ class WeaviateClient:
     # INDEXING
     # =========================================================================
 
-    async def index_chunk(self, chunk: ProcessedChunk) -> str:
-        """Index a single processed chunk"""
-        collection = self.client.collections.get(CHUNKS_COLLECTION)
-
-        properties = {
+    @staticmethod
+    def _chunk_properties(chunk: ProcessedChunk) -> Dict[str, Any]:
+        """Weaviate properties for a processed chunk"""
+        return {
             "chunk_id": chunk.chunk_id,
             "document_id": chunk.document_id,
             "source_type": chunk.source_type.value if hasattr(chunk.source_type, 'value') else str(chunk.source_type),
@@ -342,35 +388,39 @@ class WeaviateClient:
             "original_language": getattr(chunk, 'original_language', 'en'),
         }
 
-        result = collection.data.insert(properties)
+    async def index_chunk(self, chunk: ProcessedChunk) -> str:
+        """Index a single processed chunk (prefer index_chunks_batch for bulk loads)"""
+        collection = self.client.collections.get(CHUNKS_COLLECTION)
+
+        result = collection.data.insert(self._chunk_properties(chunk))
         return str(result)
 
-    async def index_chunks_batch(self, chunks: List[ProcessedChunk]) -> int:
-        """Index multiple chunks in a batch"""
+    async def index_chunks_batch(
+        self,
+        chunks: List[ProcessedChunk],
+        batch_size: int = INDEX_BATCH_SIZE
+    ) -> List[int]:
+        """
+        Index multiple chunks, batch_size objects per insert_many request
+
+        Objects that fail are logged and skipped rather than failing the
+        batch. Returns the positions in chunks of those that failed, so
+        callers can tell exactly which chunks made it in.
+        """
         collection = self.client.collections.get(CHUNKS_COLLECTION)
 
-        objects = []
-        for chunk in chunks:
-            objects.append({
-                "chunk_id": chunk.chunk_id,
-                "document_id": chunk.document_id,
-                "source_type": chunk.source_type.value if hasattr(chunk.source_type, 'value') else str(chunk.source_type),
-                "content": chunk.content,
-                "section_type": chunk.section_type,
-                "peptides_mentioned": chunk.peptides_mentioned,
-                "fda_status": chunk.fda_status.value if hasattr(chunk.fda_status, 'value') else str(chunk.fda_status),
-                "conditions_mentioned": chunk.conditions_mentioned,
-                "title": chunk.title,
-                "authors": chunk.authors,
-                "publication_date": (chunk.publication_date.isoformat() + "Z") if chunk.publication_date else None,
-                "url": chunk.url,
-                "doi": chunk.doi,
-                "citation": chunk.citation,
-                "original_language": getattr(chunk, 'original_language', 'en'),
-            })
-
-        result = collection.data.insert_many(objects)
-        return len(result.all_responses)
+        failed: List[int] = []
+        for start in range(0, len(chunks), batch_size):
+            objects = [self._chunk_properties(chunk) for chunk in chunks[start:start + batch_size]]
+            result = collection.data.insert_many(objects)
+            if result.has_errors:
+                logger.warning(
+                    f"{len(result.errors)} of {len(objects)} chunks failed to index: "
+                    f"{next(iter(result.errors.values()))}"
+                )
+                failed.extend(start + i for i in sorted(result.errors))
+
+        return failed
 
     async def index_outcome(self, outcome: Dict[str, Any]) -> str:
         """Index a journey outcome for RAG"""
@@ -391,7 +441,8 @@ class WeaviateClient:
         alpha: float = 0.5,
         source_filter: Optional[str] = None,
         peptide_filter: Optional[List[str]] = None,
-        include_outcomes: bool = True
+        include_outcomes: bool = True,
+        vector: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Perform hybrid search (BM25 + vector)
@@ -403,6 +454,8 @@ class WeaviateClient:
             source_filter: Filter by source type
             peptide_filter: Filter to specific peptides
             include_outcomes: Include user journey outcomes
+            vector: Precomputed query embedding from query_vector_model;
+                skips server-side vectorization of the query
 
         Returns:
             List of search results with scores
@@ -415,7 +468,8 @@ class WeaviateClient:
             query=query,
             limit=limit,
             alpha=alpha,
-            filters=self._build_filters(source_filter, peptide_filter)
+            filters=self._build_filters(source_filter, peptide_filter),
+            vector=vector
         )
         results.extend(chunk_results)
 
@@ -426,7 +480,8 @@ class WeaviateClient:
                 query=query,
                 limit=limit // 2,  # Fewer outcomes than research
                 alpha=alpha,
-                filters=self._build_peptide_filter(peptide_filter) if peptide_filter else None
+                filters=self._build_peptide_filter(peptide_filter) if peptide_filter else None,
+                vector=vector
             )
             results.extend(outcome_results)
 
@@ -440,14 +495,19 @@ class WeaviateClient:
         query: str,
         limit: int,
         alpha: float,
-        filters: Optional[Filter] = None
+        filters: Optional[Filter] = None,
+        vector: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Search a specific collection"""
         collection = self.client.collections.get(collection_name)
 
         try:
-            response = collection.query.hybrid(
+            # The client is synchronous; query on a worker thread so the
+            # event loop stays free (and other awaits can overlap the search)
+            response = await asyncio.to_thread(
+                collection.query.hybrid,
                 query=query,
+                vector=vector,
                 limit=limit,
                 alpha=alpha,
                 fusion_type=HybridFusion.RELATIVE_SCORE,